@@ -43,10 +43,11 @@ from modules.modals import (
 
 from modules.poll import end_poll
 from modules.reschedule import _reschedule_lock, get_reschedule_pending_matches
-from modules.stats_tracker import record_match_result
+from modules.stats_tracker import record_match_result, schedule_flush
 from modules.tournament import end_tournament_procedure, auto_end_poll, execute_registration_close_procedure
 from modules.utils import (
     autocomplete_teams,
+    extract_user_id,
     games_autocomplete,
     has_permission,
     smart_send,
@@ -91,12 +92,10 @@ async def handle_start_tournament_modal(
         await interaction.followup.send( get_message("PERMISSION", "no_permission_short"), ephemeral=True)
         return
 
-    # Reset registration closed flag for new tournament
-    from modules.tournament import _registration_lock
-    import modules.tournament as tournament_module
-    async with _registration_lock:
-        tournament_module._registration_closed = False
-        logger.debug("[TOURNAMENT] Registration flag reset for new tournament")
+    # Reset registration close guard for new tournament
+    from modules.tournament import reset_registration_close
+    reset_registration_close()
+    logger.debug("[TOURNAMENT] Registration flag reset for new tournament")
 
     try:
         tournament = load_tournament_data()
@@ -210,7 +209,7 @@ class AdminGroup(app_commands.Group):
         stats["wins"] += 1
 
         # Save updated stats
-        save_player_stats(user_id, stats)
+        save_player_stats(user_id, stats, durable=True)
 
         await interaction.response.send_message(
             f"✅ {user.mention} was credited with an additional win.",
@@ -343,19 +342,9 @@ class AdminGroup(app_commands.Group):
             winner_members = winner_team_data.get("members", [])
             loser_members = loser_team_data.get("members", [])
 
-            # Extract user IDs from mentions (safe regex execution)
-            import re
-            winner_ids = []
-            for m in winner_members:
-                id_match = re.search(r"\d+", m)
-                if id_match:
-                    winner_ids.append(id_match.group(0))
-
-            loser_ids = []
-            for m in loser_members:
-                id_match = re.search(r"\d+", m)
-                if id_match:
-                    loser_ids.append(id_match.group(0))
+            # Extract user IDs from mentions
+            winner_ids = [str(user_id) for user_id in map(extract_user_id, winner_members) if user_id]
+            loser_ids = [str(user_id) for user_id in map(extract_user_id, loser_members) if user_id]
 
             # Get game name
             game = tournament.get("poll_results", {}).get("chosen_game", "Unknown")
@@ -367,8 +356,11 @@ class AdminGroup(app_commands.Group):
                     loser_ids=loser_ids,
                     game=game,
                     winner_mentions=winner_members,
-                    loser_mentions=loser_members
+                    loser_mentions=loser_members,
+                    flush=False
                 )
+                # Player files are written in the background, batched with any reports that follow
+                schedule_flush()
                 logger.info(f"[STATS] Match stats recorded for match {match_id}")
         except Exception as e:
             logger.error(f"[STATS] Error recording match stats: {e}")
@@ -482,7 +474,7 @@ class AdminGroup(app_commands.Group):
                 task_name = f"reschedule_timer_match_{match_id}"
                 all_tasks = get_all_tasks()
                 if task_name in all_tasks:
-                    timer_task = all_tasks[task_name]["task"]
+                    timer_task = all_tasks[task_name].task
                     if not timer_task.done():
                         timer_task.cancel()
                         logger.info(f"[ADMIN] Cancelled timer task for match {match_id}")
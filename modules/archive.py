@@ -22,8 +22,9 @@ def archive_current_tournament():
 
     Returns the path to the archive file.
     """
-    tournament = load_tournament_data()
-    global_data = load_global_data()
+    # Only read here, the shared read-only copies avoid parsing the files again
+    tournament = load_tournament_data(readonly=True)
+    global_data = load_global_data(readonly=True)
 
     archive_folder = "archive"
     if not os.path.exists(archive_folder):
@@ -32,7 +33,7 @@ def archive_current_tournament():
     # Only archive tournament-relevant data from global_data
     # Exclude "games" as they're not tournament-specific and rarely change
     archive_data = {
-        "archived_on": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+        "archived_on": datetime.now().isoformat(timespec="seconds"),
         "tournament": tournament,
         "player_stats": global_data.get("player_stats", {}),
         "last_tournament_winner": global_data.get("last_tournament_winner", {}),
@@ -48,26 +49,43 @@ def archive_current_tournament():
     return filename
 
 
+HISTORY_PATH = "data/tournament_history.jsonl"
+LEGACY_HISTORY_PATH = "data/tournament_history.json"
+
+
+def _migrate_legacy_history():
+    """
+    Converts the old tournament_history.json (one JSON array) into the
+    append-only JSONL file. Runs once, the legacy file is renamed afterwards.
+    """
+    if not os.path.exists(LEGACY_HISTORY_PATH) or os.path.exists(HISTORY_PATH):
+        return
+
+    with open(LEGACY_HISTORY_PATH, "r", encoding="utf-8") as f:
+        try:
+            legacy_entries = json.load(f)
+        except json.JSONDecodeError:
+            logger.warning("[HISTORY] tournament_history.json corrupted. Skipping migration.")
+            legacy_entries = []
+
+    with open(HISTORY_PATH, "w", encoding="utf-8") as f:
+        for entry in legacy_entries:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    os.replace(LEGACY_HISTORY_PATH, LEGACY_HISTORY_PATH + ".migrated")
+    logger.info(f"[HISTORY] Migrated {len(legacy_entries)} entries to {HISTORY_PATH}")
+
+
 def update_tournament_history(winner_ids: list[str], chosen_game: str, mvp_name: str = None):
     """
-    Updates tournament_history.json with a new entry for the completed tournament.
+    Appends a new entry for the completed tournament to tournament_history.jsonl.
+    Only the new line is written, the existing history is never rewritten.
 
     :param winner_ids: List of Discord user IDs of the winners (as strings)
     :param chosen_game: The name of the game played.
     :param mvp_name: Optional name of the MVP player.
     """
-    history_path = "data/tournament_history.json"
-
-    # Prepare file
-    if not os.path.exists(history_path):
-        history_data = []
-    else:
-        with open(history_path, "r", encoding="utf-8") as f:
-            try:
-                history_data = json.load(f)
-            except json.JSONDecodeError:
-                logger.warning("[HISTORY] tournament_history.json corrupted. Creating new file.")
-                history_data = []
+    _migrate_legacy_history()
 
     # Get winner names from player stats files
     from modules.stats_tracker import load_player_stats
@@ -83,18 +101,16 @@ def update_tournament_history(winner_ids: list[str], chosen_game: str, mvp_name:
 
     # Tournament entry
     history_entry = {
-        "ended_on": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
+        "ended_on": datetime.now().isoformat(timespec="seconds"),
         "game": chosen_game,
         "winner_ids": winner_ids,
         "winners": winners,
         "mvp": mvp_name or "Unknown",
     }
 
-    # Append to list
-    history_data.append(history_entry)
-
-    # Save
-    with open(history_path, "w", encoding="utf-8") as f:
-        json.dump(history_data, f, indent=4, ensure_ascii=False)
+    # Append as a single line
+    os.makedirs(os.path.dirname(HISTORY_PATH), exist_ok=True)
+    with open(HISTORY_PATH, "a", encoding="utf-8") as f:
+        f.write(json.dumps(history_entry, ensure_ascii=False) + "\n")
 
-    logger.info(f"[HISTORY] Tournament completed and added to tournament_history.json: {chosen_game}.")
+    logger.info(f"[HISTORY] Tournament completed and added to tournament_history.jsonl: {chosen_game}.")
@@ -1,5 +1,6 @@
 # modules/datastorage.py
 
+import hashlib
 import json
 import os
 import shutil
@@ -10,6 +11,11 @@ from typing import Dict, Any, Optional
 import discord
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is used as fallback
+    orjson = None
+
 # Local modules
 from modules.logger import logger
 from modules.config import CONFIG
@@ -81,15 +87,95 @@ DEFAULT_TOURNAMENT_DATA = {
 # Atomic Write Helper
 # =======================================
 
-def _atomic_write(file_path: str, data: Dict[str, Any], indent: int = 4) -> None:
+def json_loads(raw: bytes) -> Any:
+    """
+    Parse JSON from raw (UTF-8) bytes or a string, using orjson if it is installed.
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep catching the latter.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def json_dumps(data: Any, pretty: bool = True) -> bytes:
+    """
+    Serialize data to UTF-8 JSON bytes, using orjson if it is installed.
+    orjson only supports 2-space indentation, the stdlib fallback matches it.
+
+    :param data: Data to serialize
+    :param pretty: Indent the output; compact output is smaller and faster to write
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+# Parsed JSON shared with read-only callers: path -> ((mtime_ns, size), data)
+_readonly_cache: Dict[str, tuple] = {}
+
+# Last content written by _atomic_write: path -> (sha1 digest, mtime_ns after write)
+_last_written: Dict[str, tuple] = {}
+
+
+def _read_json_file(file_path: str, readonly: bool = False) -> Any:
+    """
+    Read and parse a JSON file.
+
+    With readonly=True the parsed object is cached and reused until the file's
+    mtime or size changes. Callers must not mutate it. Without readonly a fresh
+    object is parsed every time, safe to modify and save back.
+
+    :param file_path: Path of the JSON file
+    :param readonly: Return the shared cached object
+    :return: Parsed JSON data
+    :raises json.JSONDecodeError: If the file is corrupted
+    """
+    if readonly:
+        stat = os.stat(file_path)
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        cached = _readonly_cache.get(file_path)
+        if cached and cached[0] == cache_key:
+            return cached[1]
+
+    with open(file_path, "rb") as file:
+        data = json_loads(file.read())
+
+    if readonly:
+        _readonly_cache[file_path] = (cache_key, data)
+    return data
+
+
+def _atomic_write(file_path: str, data: Dict[str, Any], indent: int = 4, fast: bool = False) -> None:
     """
     Atomically write JSON data to a file.
     Writes to temp file first, then renames to avoid corruption.
 
     :param file_path: Target file path
     :param data: Data to write
-    :param indent: JSON indentation
+    :param indent: JSON indentation (ignored when fast is set)
+    :param fast: Serialize via json_dumps (orjson if available)
     """
+    if fast:
+        content = json_dumps(data)
+    else:
+        content = json.dumps(data, indent=indent, ensure_ascii=False).encode("utf-8")
+
+    # Skip the write if we already wrote exactly this content and nobody touched the file since
+    digest = hashlib.sha1(content).digest()
+    last_written = _last_written.get(file_path)
+    if last_written and last_written[0] == digest:
+        try:
+            if os.stat(file_path).st_mtime_ns == last_written[1]:
+                logger.debug(f"[DATA] Skipped unchanged write to {file_path}")
+                return
+        except OSError:
+            pass
+
     # Ensure directory exists
     directory = os.path.dirname(file_path)
     if directory and not os.path.exists(directory):
@@ -98,11 +184,14 @@ def _atomic_write(file_path: str, data: Dict[str, Any], indent: int = 4) -> None
     # Write to temporary file first
     temp_fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
     try:
-        with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=indent, ensure_ascii=False)
+        # Content is already UTF-8 encoded, write it without a text layer
+        with os.fdopen(temp_fd, 'wb') as f:
+            f.write(content)
 
         # Atomic rename (replaces original file)
         os.replace(temp_path, file_path)
+        _readonly_cache.pop(file_path, None)
+        _last_written[file_path] = (digest, os.stat(file_path).st_mtime_ns)
 
     except Exception as e:
         # Clean up temp file on error
@@ -261,16 +350,19 @@ def init_file(file_path: str, default_content: Dict[str, Any]) -> None:
 
 
 # Functions for global data (data.json)
-def load_global_data() -> Dict[str, Any]:
-    """Load global data from data.json."""
+def load_global_data(readonly: bool = False) -> Dict[str, Any]:
+    """
+    Load global data from data.json.
+
+    :param readonly: Return the cached shared dict (must not be modified)
+    """
     if os.path.exists(DATA_FILE_PATH):
         try:
-            with open(DATA_FILE_PATH, "r", encoding="utf-8") as file:
-                data = json.load(file)
-                if not isinstance(data, dict):
-                    logger.error("⚠ Global data file format is incorrect!")
-                    return {}
-                return data
+            data = _read_json_file(DATA_FILE_PATH, readonly=readonly)
+            if not isinstance(data, dict):
+                logger.error("⚠ Global data file format is incorrect!")
+                return {}
+            return data
         except json.JSONDecodeError:
             logger.error("⚠ Global data file is corrupted. Returning empty data.")
             return {}
@@ -288,7 +380,7 @@ def save_global_data(data: Dict[str, Any]) -> None:
     if not isinstance(data, dict):
         raise ValueError("Global data must be a dictionary")
 
-    _atomic_write(DATA_FILE_PATH, data)
+    _atomic_write(DATA_FILE_PATH, data, fast=True)
     logger.debug(f"[DATA] Global data saved to {DATA_FILE_PATH}")
 
 
@@ -339,20 +431,23 @@ def load_games() -> Dict[str, Any]:
         return {}
 
 
-def load_tournament_data() -> Dict[str, Any]:
-    """Load tournament data from tournament.json."""
+def load_tournament_data(readonly: bool = False) -> Dict[str, Any]:
+    """
+    Load tournament data from tournament.json.
+
+    :param readonly: Return the cached shared dict (must not be modified)
+    """
     if os.path.exists(TOURNAMENT_FILE_PATH):
         try:
-            with open(TOURNAMENT_FILE_PATH, "r", encoding="utf-8") as file:
-                tournament = json.load(file)
-                if not isinstance(tournament, dict):
-                    logger.error("⚠ Tournament file format is incorrect!")
-                    return DEFAULT_TOURNAMENT_DATA.copy()
-                # Add missing keys
-                for key, value in DEFAULT_TOURNAMENT_DATA.items():
-                    if key not in tournament:
-                        tournament[key] = value
-                return tournament
+            tournament = _read_json_file(TOURNAMENT_FILE_PATH, readonly=readonly)
+            if not isinstance(tournament, dict):
+                logger.error("⚠ Tournament file format is incorrect!")
+                return DEFAULT_TOURNAMENT_DATA.copy()
+            # Add missing keys (idempotent, also fine on the cached dict)
+            for key, value in DEFAULT_TOURNAMENT_DATA.items():
+                if key not in tournament:
+                    tournament[key] = value
+            return tournament
         except json.JSONDecodeError:
             logger.error("⚠ Tournament file is corrupted. Returning default data.")
             return DEFAULT_TOURNAMENT_DATA.copy()
@@ -370,7 +465,7 @@ def save_tournament_data(tournament: Dict[str, Any]) -> None:
     if not isinstance(tournament, dict):
         raise ValueError("Tournament data must be a dictionary")
 
-    _atomic_write(TOURNAMENT_FILE_PATH, tournament)
+    _atomic_write(TOURNAMENT_FILE_PATH, tournament, fast=True)
     logger.debug(f"[TOURNAMENT] Tournament data saved to {TOURNAMENT_FILE_PATH}")
 
 
@@ -433,10 +528,12 @@ def remove_game(game_id: str) -> None:
     logger.info(f"[GAME] Game '{game_id}' was deleted.")
 
 
-def delete_tournament_file() -> None:
+def delete_tournament_file() -> bool:
     """
     Delete tournament.json file.
     Uses TOURNAMENT_FILE_PATH constant for consistency.
+
+    :return: True if the file is gone afterwards (deleted or not present)
     """
     try:
         if os.path.exists(TOURNAMENT_FILE_PATH):
@@ -444,5 +541,7 @@ def delete_tournament_file() -> None:
             logger.info(f"[RESET] tournament.json successfully deleted")
         else:
             logger.debug("[RESET] tournament.json was not present")
+        return True
     except OSError as e:
         logger.error(f"[RESET] Failed to delete tournament.json: {e}")
+        return False
@@ -307,7 +307,7 @@ class DevGroup(app_commands.Group):
         from modules.tournament import auto_end_poll
 
         # Pass current channel + client
-        asyncio.create_task(auto_end_poll(interaction.client, interaction.channel, delay_seconds=10))
+        add_task("auto_end_poll", asyncio.create_task(auto_end_poll(interaction.client, interaction.channel, delay_seconds=10)))
 
     @app_commands.command(
         name="simulate_registration_close",
@@ -326,7 +326,10 @@ class DevGroup(app_commands.Group):
 
         from modules.tournament import close_registration_after_delay
 
-        asyncio.create_task(close_registration_after_delay(delay_seconds=10, channel=interaction.channel))
+        add_task(
+            "close_registration",
+            asyncio.create_task(close_registration_after_delay(delay_seconds=10, channel=interaction.channel)),
+        )
 
     @app_commands.command(
         name="simulate_full_flow",
@@ -344,11 +347,9 @@ class DevGroup(app_commands.Group):
             ephemeral=True,
         )
 
-        # Reset registration closed flag for new test tournament
-        from modules.tournament import _registration_lock
-        import modules.tournament as tournament_module
-        async with _registration_lock:
-            tournament_module._registration_closed = False
+        # Reset registration close guard for new test tournament
+        from modules.tournament import reset_registration_close
+        reset_registration_close()
 
         # Load dummy poll options
         poll_options = load_games()
@@ -416,7 +417,7 @@ class DevGroup(app_commands.Group):
         # Simulate poll end (which will automatically trigger registration close)
         # Note: auto_end_poll calls close_registration_after_delay automatically
         # based on the registration_end timestamp, so no manual call needed
-        asyncio.create_task(auto_end_poll(interaction.client, interaction.channel, delay_seconds=10))
+        add_task("auto_end_poll", asyncio.create_task(auto_end_poll(interaction.client, interaction.channel, delay_seconds=10)))
 
     @app_commands.command(
         name="reset_tournament",
@@ -429,6 +430,10 @@ class DevGroup(app_commands.Group):
             return
 
         from modules.dataStorage import DEFAULT_TOURNAMENT_DATA
+        from modules.task_manager import cancel_tournament_tasks
+
+        # Timers of the old tournament must not fire on the reset state
+        cancel_tournament_tasks()
 
         # Reset to default state
         save_tournament_data(DEFAULT_TOURNAMENT_DATA.copy())
@@ -781,7 +786,7 @@ class DevGroup(app_commands.Group):
             report.append("  ❌ No active tasks found")
         else:
             for name, entry in tasks.items():
-                task = entry["task"]
+                task = entry.task
                 status = "✅ completed" if task.done() else "🟢 running"
                 report.append(f"  {name}: {status}")
 
@@ -813,8 +818,8 @@ class DevGroup(app_commands.Group):
         other_tasks = []
 
         for name, entry in tasks.items():
-            task = entry["task"]
-            coro = entry["coro"]
+            task = entry.task
+            coro = entry.coro_name
 
             # Determine task category
             if name.startswith("reschedule_timer"):
@@ -1078,7 +1083,7 @@ class DevGroup(app_commands.Group):
             task_name = f"reschedule_timer_match_{match_id}"
             all_tasks = get_all_tasks()
             if task_name in all_tasks:
-                timer_task = all_tasks[task_name]["task"]
+                timer_task = all_tasks[task_name].task
                 if not timer_task.done():
                     timer_task.cancel()
 
@@ -1202,10 +1207,8 @@ class DevGroup(app_commands.Group):
 
         # Terminate running tasks (e.g. reminder, background loops, etc.)
         for name, entry in get_all_tasks().items():
-            task = entry.get("task")
-            if task:
-                task.cancel()
-                logger.debug(f"[SYSTEM] Task '{name}' was stopped.")
+            entry.task.cancel()
+            logger.debug(f"[SYSTEM] Task '{name}' was stopped.")
 
         # Optional: Wait to allow tasks time to cleanly terminate
         await asyncio.sleep(1)
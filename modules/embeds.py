@@ -2,8 +2,8 @@
 
 import json
 import os
-import re
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Optional
 from zoneinfo import ZoneInfo
 
@@ -15,7 +15,7 @@ from modules.logger import logger
 
 # Local modules
 from modules.config import CONFIG
-from modules.utils import smart_send
+from modules.utils import extract_user_id, smart_send
 from modules.reschedule_view import RescheduleView
 
 # Cache for common messages
@@ -79,6 +79,16 @@ def get_message(category: str, key: str, **kwargs) -> str:
         return f"[Error loading message: {category}.{key}]"
 
 
+@lru_cache(maxsize=64)
+def _read_template_file(path: str, mtime_ns: int) -> dict:
+    """
+    Reads and parses a template file. Cached per (path, mtime), so repeated
+    lookups of the same template skip the file I/O. Callers must not modify the result.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
 def load_embed_template(template_name: str, language: str = None) -> dict:
     """
     Loads a language-sensitive embed template from:
@@ -97,8 +107,8 @@ def load_embed_template(template_name: str, language: str = None) -> dict:
     for path in paths_to_try:
         if os.path.isfile(path):
             try:
-                with open(path, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                # mtime is part of the cache key, so edited locale files are picked up
+                return _read_template_file(path, os.stat(path).st_mtime_ns)
             except json.JSONDecodeError as e:
                 logger.error(f"[EMBED LOADER] Error parsing {path}: {e}")
                 return {}
@@ -269,13 +279,15 @@ async def send_tournament_stats(
     template = load_embed_template("tournament_stats").get("TOURNAMENT_STATS")
     if not template:
         logger.error("[EMBED] TOURNAMENT_STATS template missing.")
+        # The interaction may already be deferred, it still needs an answer
+        await smart_send(interaction, content=get_message("ERRORS", "template_missing"), ephemeral=True)
         return
 
     # Build embed
     embed = build_embed_from_template(template, placeholders)
 
-    # Send response
-    await interaction.response.send_message(embed=embed)
+    # Send response (followup if the caller deferred)
+    await smart_send(interaction, embed=embed)
 
 
 async def send_match_reminder(channel: TextChannel, placeholders: dict):
@@ -330,11 +342,10 @@ async def send_notify_team_members(
     failed = False
 
     for member_str in all_members:
-        user_id_match = re.search(r"\d+", member_str)
-        if not user_id_match:
+        user_id = extract_user_id(member_str)
+        if not user_id:
             continue
 
-        user_id = int(user_id_match.group(0))
         user = interaction.guild.get_member(user_id)
 
         if user:
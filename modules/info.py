@@ -1,11 +1,11 @@
 # modules/info.py
 
 from modules.embeds import get_message
-import re
-from collections import Counter
+import asyncio
+import os
+import time
 from datetime import datetime
 from typing import Optional
-from zoneinfo import ZoneInfo
 
 import discord
 from discord import Embed, Interaction, User, app_commands
@@ -14,7 +14,7 @@ from discord.ext import commands
 
 # Local modules
 from modules.config import CONFIG
-from modules.dataStorage import load_global_data, load_tournament_data, save_global_data
+from modules.dataStorage import load_global_data, load_tournament_data
 from modules.embeds import send_status, send_tournament_stats, load_embed_template, build_embed_from_template, send_match_schedule
 from modules.logger import logger
 from modules.stats_tracker import (
@@ -25,43 +25,159 @@ from modules.stats_tracker import (
     get_top_games,
     format_time_since
 )
-from modules.utils import autocomplete_players, autocomplete_teams
+from modules.utils import (
+    autocomplete_players,
+    autocomplete_teams,
+    extract_user_id,
+    get_bot_timezone,
+    now_in_bot_timezone,
+    parse_iso_datetime,
+)
+
+# Number of matches shown in the match history view
+MATCH_HISTORY_LIMIT = 25
+
+# Number of players shown on the leaderboard
+LEADERBOARD_LIMIT = 25
+_PLURAL_SUFFIX = {1: ""}
+
+# Aggregates over all player files are cached for this many seconds,
+# as long as no player file was written in between
+STATS_CACHE_TTL = 60
+_stats_cache = {}
 
 # ----------------------------------------
 # Helper Functions
 # ----------------------------------------
 
 
-def get_leaderboard() -> str:
+def _stats_cache_key() -> tuple:
     """
-    Returns a formatted leaderboard based on player wins.
-    Uses individual player files.
+    Returns a key that changes when player stats change, either through this
+    process (version counter) or on disk (directory mtime).
     """
-    from modules.stats_tracker import list_all_players, load_player_stats
+    from modules.stats_tracker import PLAYER_STATS_DIR, get_stats_version
+
+    try:
+        dir_mtime = os.stat(PLAYER_STATS_DIR).st_mtime_ns
+    except OSError:
+        dir_mtime = None
+    return get_stats_version(), dir_mtime
+
+
+def _get_cached(name: str, builder):
+    """
+    Returns a cached aggregate or rebuilds it if stale.
+
+    :param name: Cache entry name
+    :param builder: Callable that computes the value
+    :return: Cached or freshly built value
+    """
+    key = _stats_cache_key()
+    now = time.monotonic()
+    entry = _stats_cache.get(name)
+
+    if entry and entry[0] == key and now - entry[1] < STATS_CACHE_TTL:
+        return entry[2]
+
+    value = builder()
+    _stats_cache[name] = (key, now, value)
+    return value
+
+
+def _build_player_ranking() -> tuple:
+    """
+    Loads all player files once and sorts them by tournament wins.
+
+    :return: Tuple of (player_count, ranking) where ranking is a list of
+             (user_id, stats) sorted by wins descending
+    """
+    from modules.stats_tracker import list_all_players, load_many_player_stats
 
     player_ids = list_all_players()
 
-    if not player_ids:
-        return "No statistics available."
+    player_data = [
+        (user_id, stats)
+        for user_id, stats in load_many_player_stats(player_ids).items()
+        if stats
+    ]
 
-    # Load all player stats
-    player_data = []
-    for user_id in player_ids:
-        stats = load_player_stats(user_id)
-        if stats:
-            player_data.append((user_id, stats))
+    player_data.sort(key=lambda item: item[1].get("wins", 0), reverse=True)
+    return len(player_ids), player_data
 
-    if not player_data:
-        return "No statistics available."
 
-    # Sort by tournament wins
-    sorted_players = sorted(player_data, key=lambda item: item[1].get("wins", 0), reverse=True)
+def get_player_ranking() -> tuple:
+    """
+    Returns the cached player ranking (see _build_player_ranking).
+    Rebuilt only when player stats changed or STATS_CACHE_TTL expired,
+    leaderboard, summary and MVP all read from it.
+    """
+    return _get_cached("ranking", _build_player_ranking)
+
 
-    lines = []
-    for idx, (user_id, data) in enumerate(sorted_players, start=1):
-        name = data.get("display_name", data.get("mention", f"<@{user_id}>"))
-        wins = data.get("wins", 0)
-        lines.append(f"{idx}. {name} – 🏅 {wins} Win{'s' if wins != 1 else ''}")
+def _build_player_lookup() -> tuple:
+    """
+    Builds lookup structures for resolving a player by ID, mention or name.
+
+    :return: Tuple of (players, name_index) where players maps user ID -> stats
+             and name_index maps lowercased display name -> user ID
+    """
+    _, ranking = get_player_ranking()
+    players = dict(ranking)
+
+    name_index = {}
+    for user_id, stats in ranking:
+        name_index.setdefault(stats.get("display_name", "").lower(), user_id)
+
+    return players, name_index
+
+
+def find_player(target: str) -> Optional[tuple]:
+    """
+    Resolves a player from an ID, mention or (partial) display name.
+    ID/mention and exact name hits are dict lookups, only partial names need a scan.
+
+    :param target: User input
+    :return: Tuple of (user_id, stats) or None if no player matches
+    """
+    players, name_index = _get_cached("player_lookup", _build_player_lookup)
+
+    # ID or mention (<@123>, <@!123>)
+    candidate_id = target.strip().lstrip("<@!").rstrip(">")
+    if candidate_id in players:
+        return candidate_id, players[candidate_id]
+
+    # Exact display name
+    target_lower = target.lower()
+    user_id = name_index.get(target_lower)
+    if user_id:
+        return user_id, players[user_id]
+
+    # Partial display name or mention
+    for user_id, stats in players.items():
+        if target_lower in stats.get("display_name", "").lower() or target in stats.get("mention", ""):
+            return user_id, stats
+
+    return None
+
+
+def get_leaderboard(limit: Optional[int] = LEADERBOARD_LIMIT) -> str:
+    """
+    Returns a formatted leaderboard based on player wins.
+    Uses individual player files, via the cached ranking.
+
+    :param limit: Number of players to show, None for everyone
+    """
+    _, ranking = get_player_ranking()
+
+    if not ranking:
+        return "No statistics available."
+
+    lines = [
+        f"{idx}. {data.get('display_name', data.get('mention', f'<@{user_id}>'))}"
+        f" – 🏅 {data.get('wins', 0)} Win{_PLURAL_SUFFIX.get(data.get('wins', 0), 's')}"
+        for idx, (user_id, data) in enumerate(ranking[:limit], start=1)
+    ]
 
     leaderboard = "\n".join(lines)
     return leaderboard
@@ -107,9 +223,10 @@ def build_stats_embed(user, stats: dict, guild: discord.Guild = None) -> Embed:
     else:
         streak_text = messages.get("no_nemesis", "–")
 
-    # Timeline
+    # Timeline (one reference time for all relative timestamps in this embed)
     timeline = stats.get("timeline", {})
-    last_tournament = format_time_since(timeline.get("last_tournament"), language)
+    now = now_in_bot_timezone()
+    last_tournament = format_time_since(timeline.get("last_tournament"), language, now=now)
     last_game = timeline.get("last_game") or messages.get("never", "Never")
 
     # Per-game stats
@@ -134,7 +251,7 @@ def build_stats_embed(user, stats: dict, guild: discord.Guild = None) -> Embed:
     # Nemesis & Rival
     from modules.stats_tracker import load_player_stats
 
-    nemesis = get_nemesis(str(user.id))
+    nemesis = get_nemesis(str(user.id), stats)
     if nemesis:
         nemesis_id, nemesis_stats = nemesis
         # Try to get fresh display name from guild first, fallback to stored name
@@ -158,7 +275,7 @@ def build_stats_embed(user, stats: dict, guild: discord.Guild = None) -> Embed:
     else:
         nemesis_text = messages.get("no_nemesis", "–")
 
-    rival = get_favorite_rival(str(user.id))
+    rival = get_favorite_rival(str(user.id), stats)
     if rival:
         rival_id, rival_stats = rival
         # Try to get fresh display name from guild first, fallback to stored name
@@ -269,7 +386,7 @@ def build_stats_embed(user, stats: dict, guild: discord.Guild = None) -> Embed:
     )
 
     # Footer
-    player_since = format_time_since(timeline.get("first_tournament"), language)
+    player_since = format_time_since(timeline.get("first_tournament"), language, now=now)
     footer_template = embed_config.get("footer", "Player since PLACEHOLDER_PLAYER_SINCE")
     footer_text = footer_template.replace("PLACEHOLDER_PLAYER_SINCE", player_since)
     embed.set_footer(text=footer_text)
@@ -277,33 +394,35 @@ def build_stats_embed(user, stats: dict, guild: discord.Guild = None) -> Embed:
     return embed
 
 
+def _summarize_player_wins() -> tuple:
+    """
+    Aggregates tournament wins over all players from the cached ranking.
+
+    :return: Tuple of (total_players, total_wins, best_entry) where best_entry is
+             (user_id, stats) of the player with most wins or None
+    """
+    total_players, ranking = get_player_ranking()
+    total_wins = sum(stats.get("wins", 0) for _, stats in ranking)
+
+    # Ranking is sorted, the first entry is the best player unless nobody has won yet
+    best_entry = ranking[0] if ranking and ranking[0][1].get("wins", 0) > 0 else None
+
+    return total_players, total_wins, best_entry
+
+
 def get_tournament_summary() -> str:
     """
     Returns a small summary of all statistics (players, wins, win rate).
     """
-    from modules.stats_tracker import list_all_players, load_player_stats
-
-    player_ids = list_all_players()
-    total_players = len(player_ids)
-    total_wins = 0
-    best_player_id = None
-    best_wins = 0
+    total_players, total_wins, best_entry = _summarize_player_wins()
 
-    # Load all player stats to calculate totals
-    for user_id in player_ids:
-        stats = load_player_stats(user_id)
-        if stats:
-            wins = stats.get("wins", 0)
-            total_wins += wins
-            if wins > best_wins:
-                best_wins = wins
-                best_player_id = user_id
-
-    if best_player_id:
-        best_player_data = load_player_stats(best_player_id)
-        best_name = best_player_data.get("display_name", best_player_data.get("mention", f"<@{best_player_id}>")) if best_player_data else f"<@{best_player_id}>"
+    if best_entry:
+        best_player_id, best_player_data = best_entry
+        best_name = best_player_data.get("display_name", best_player_data.get("mention", f"<@{best_player_id}>"))
+        best_wins = best_player_data.get("wins", 0)
     else:
         best_name = "Nobody"
+        best_wins = 0
 
     output = (
         f"📊 **Tournament Overview**\n\n"
@@ -315,36 +434,16 @@ def get_tournament_summary() -> str:
     return output
 
 
-def update_global_game_stats(game_name: str):
-    """
-    Updates the global statistics for the most played game.
-    :param game_name: The name of the played game (e.g. "Beyond all Reason").
-    """
-    global_data = load_global_data()
-
-    # Initialize if not yet present
-    if "game_stats" not in global_data:
-        global_data["game_stats"] = {}
-
-    if game_name not in global_data["game_stats"]:
-        global_data["game_stats"][game_name] = 0
-
-    global_data["game_stats"][game_name] += 1
-
-    save_global_data(global_data)
-    logger.info(f"Game statistics updated: {game_name} has now been played {global_data['game_stats'][game_name]}x.")
-
-
 def get_favorite_game() -> str:
     """Returns the most played game."""
-    global_data = load_global_data()
+    global_data = load_global_data(readonly=True)
     game_stats = global_data.get("game_stats", {})
 
     if not game_stats:
         return "No games played."
 
-    most_played_game, count = max(game_stats.items(), key=lambda item: item[1])
-    return f"{most_played_game} (played {count}x)"
+    most_played_game = max(game_stats, key=game_stats.get)
+    return f"{most_played_game} (played {game_stats[most_played_game]}x)"
 
 
 def get_mvp() -> str:
@@ -352,41 +451,27 @@ def get_mvp() -> str:
     Determines the MVP (player with most wins) from global statistics.
     Returns the player name or a user mention.
     """
-    from modules.stats_tracker import list_all_players, load_player_stats
+    # Best player from the cached ranking (shared with leaderboard and summary)
+    _, _, best_entry = _summarize_player_wins()
 
-    player_ids = list_all_players()
-
-    if not player_ids:
-        return None
-
-    # Load all players and find one with most wins
-    player_data = []
-    for user_id in player_ids:
-        stats = load_player_stats(user_id)
-        if stats:
-            player_data.append((user_id, stats))
-
-    if not player_data:
-        return None
-
-    # Find player with most wins
-    sorted_players = sorted(player_data, key=lambda item: item[1].get("wins", 0), reverse=True)
-
-    if not sorted_players or sorted_players[0][1].get("wins", 0) == 0:
+    if not best_entry:
         return None  # No wins available
 
-    mvp_id, mvp_data = sorted_players[0]
+    mvp_id, mvp_data = best_entry
     mvp_name = mvp_data.get("display_name", f"<@{mvp_id}>")
 
     return mvp_name
 
 
-def get_winner_ids() -> list:
+def get_winner_ids(tournament: dict = None) -> list:
     """
     Determines the user IDs of the winners based on current tournament standings.
     Searches for the team with the most wins.
+
+    :param tournament: Tournament data snapshot to use, loaded read-only if omitted
     """
-    tournament = load_tournament_data()
+    if tournament is None:
+        tournament = load_tournament_data(readonly=True)
     teams = tournament.get("teams", {})
 
     if not teams:
@@ -397,28 +482,50 @@ def get_winner_ids() -> list:
     winning_team = max(teams.values(), key=lambda t: t.get("wins", 0))
     winner_members = winning_team.get("members", [])
 
-    winner_ids = []
-    for member in winner_members:
-        match = re.search(r"\d+", member)
-        if match:
-            winner_ids.append(match.group(0))
+    winner_ids = [str(user_id) for user_id in map(extract_user_id, winner_members) if user_id]
 
     logger.info(f"[GET_WINNER_IDS] Winner IDs found: {winner_ids}")
     return winner_ids
 
 
-def get_winner_team(winner_ids: list) -> Optional[str]:
+def _build_member_index(teams: dict) -> dict:
+    """
+    Builds a reverse index of member user ID -> team name.
+
+    :param teams: Teams dict from tournament data
+    :return: Dict mapping user ID strings to team names
+    """
+    index = {}
+    for team_name, team_info in teams.items():
+        for member in team_info.get("members", []):
+            user_id = extract_user_id(member)
+            if user_id:
+                index[str(user_id)] = team_name
+    return index
+
+
+def get_winner_team(winner_ids: list, tournament: dict = None) -> Optional[str]:
     """
     Finds the team based on winner player IDs.
     Returns the team name or None if not found.
+
+    :param winner_ids: User IDs of the winners
+    :param tournament: Tournament data snapshot to use, loaded read-only if omitted
     """
-    tournament = load_tournament_data()
-    teams = tournament.get("teams", {})
+    if not winner_ids:
+        return None
 
-    for team_name, team_info in teams.items():
-        team_members = [str(member_id) for member_id in team_info.get("members", [])]
-        if all(winner_id in team_members for winner_id in winner_ids):
-            return team_name
+    if tournament is None:
+        tournament = load_tournament_data(readonly=True)
+    member_index = _build_member_index(tournament.get("teams", {}))
+
+    # The first winner determines the candidate team, the rest must match (stops at first mismatch)
+    team_name = member_index.get(str(winner_ids[0]))
+    if team_name is None:
+        return None
+
+    if all(member_index.get(str(winner_id)) == team_name for winner_id in winner_ids[1:]):
+        return team_name
 
     return None
 
@@ -471,52 +578,48 @@ class InfoGroup(app_commands.Group):
     async def stats_overview(self, interaction: Interaction, view: Choice[str]):
         """Displays tournament overview, leaderboard, or match history."""
         if view.value == "leaderboard":
-            # Show leaderboard
-            board = get_leaderboard()
+            # Reading every player file can exceed the 3s interaction window
+            await interaction.response.defer(thinking=True)
+
+            # Show leaderboard (file reads run off the event loop)
+            board = await asyncio.to_thread(get_leaderboard)
             template = load_embed_template("info").get("LEADERBOARD")
             if template:
                 embed = build_embed_from_template(template, {"leaderboard": board})
             else:
                 # Fallback
                 embed = Embed(title="🏆 Leaderboard", description=board, color=0xF1C40F)
-            await interaction.response.send_message(embed=embed)
+            await interaction.followup.send(embed=embed)
 
         elif view.value == "summary":
+            # Same as leaderboard: scans all player files, so answer via followup
+            await interaction.response.defer(thinking=True)
+
             # Show tournament statistics
-            from modules.stats_tracker import list_all_players, load_player_stats
-
-            global_data = load_global_data()
-            tournament_history = global_data.get("tournament_history", [])
-
-            player_ids = list_all_players()
-            total_players = len(player_ids)
-            total_wins = 0
-            best_player_id = None
-            best_player_wins = 0
-
-            for user_id in player_ids:
-                stats = load_player_stats(user_id)
-                if stats:
-                    wins = stats.get("wins", 0)
-                    total_wins += wins
-                    if wins > best_player_wins:
-                        best_player_wins = wins
-                        best_player_id = user_id
-
-            if best_player_id:
-                best_player_data = load_player_stats(best_player_id)
-                best_player = f"{best_player_data['display_name']} ({best_player_wins} wins)"
+            global_data = load_global_data(readonly=True)
+            game_stats = global_data.get("game_stats", {})
+
+            total_players, total_wins, best_entry = await asyncio.to_thread(_summarize_player_wins)
+
+            if best_entry:
+                best_player_id, best_player_data = best_entry
+                best_player_name = best_player_data.get("display_name", f"<@{best_player_id}>")
+                best_player = f"{best_player_name} ({best_player_data.get('wins', 0)} wins)"
             else:
                 best_player = "Nobody"
 
-            game_counter = Counter(entry["game"] for entry in tournament_history if "game" in entry)
-            favorite_game = f"{game_counter.most_common(1)[0][0]} ({game_counter.most_common(1)[0][1]}x)" if game_counter else "No games played"
+            # game_stats is maintained at tournament end, no need to rescan the history
+            if game_stats:
+                most_played_game = max(game_stats, key=game_stats.get)
+                favorite_game = f"{most_played_game} ({game_stats[most_played_game]}x)"
+            else:
+                favorite_game = "No games played"
 
             await send_tournament_stats(interaction, total_players, total_wins, best_player, favorite_game)
 
         elif view.value == "history":
             # Show match history
-            tournament = load_tournament_data()
+            tournament = load_tournament_data(readonly=True)
             matches = tournament.get("matches", [])
 
             if not matches:
@@ -534,18 +637,26 @@ class InfoGroup(app_commands.Group):
                     color=0x7289DA,
                 )
 
-            for match in matches[:25]:  # Discord limit
+            # Only render the most recent matches, newest first
+            recent_matches = matches[-MATCH_HISTORY_LIMIT:][::-1]
+
+            lines = []
+            for match in recent_matches:
                 result = match.get("result", "Unknown").upper()
                 team_name = match.get("team", "Unknown")
                 opponent = match.get("opponent", "Unknown")
                 timestamp = match.get("timestamp", "No timestamp")
                 outcome_symbol = "✅" if result == "WIN" else "❌"
+                lines.append(f"{outcome_symbol} **{result}** – {team_name} vs {opponent}  🕑 {timestamp}")
 
-                embed.add_field(
-                    name=f"{team_name} vs {opponent}",
-                    value=f"{outcome_symbol} Result: **{result}**\n🕑 {timestamp}",
-                    inline=False,
-                )
+            history_text = "\n".join(lines)
+            # Discord embed description limit is 4096 characters
+            if len(history_text) > 4096:
+                history_text = history_text[:4092] + "..."
+            embed.description = history_text
+
+            if len(matches) > MATCH_HISTORY_LIMIT:
+                embed.set_footer(text=f"Showing the latest {MATCH_HISTORY_LIMIT} of {len(matches)} matches")
 
             await interaction.response.send_message(embed=embed)
 
@@ -553,9 +664,9 @@ class InfoGroup(app_commands.Group):
     @app_commands.describe(target="Player (mention or name) or team name")
     async def stats_smart(self, interaction: Interaction, target: Optional[str] = None):
         """Displays statistics for yourself, a player, or a team."""
-        from modules.stats_tracker import list_all_players, load_player_stats
+        from modules.stats_tracker import load_player_stats
 
-        tournament = load_tournament_data()
+        tournament = load_tournament_data(readonly=True)
 
         # 1. No input → own stats
         if not target:
@@ -570,30 +681,25 @@ class InfoGroup(app_commands.Group):
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        # 2. Is it a player? (ID, mention, or display name)
-        player_ids = list_all_players()
-        for user_id in player_ids:
-            stats = load_player_stats(user_id)
-            if not stats:
-                continue
+        # A cold player cache means reading every player file, acknowledge first
+        await interaction.response.defer(ephemeral=True, thinking=True)
 
-            name_match = stats.get("display_name", "").lower()
-            mention_match = stats.get("mention", "").replace("<@", "").replace(">", "")
-
-            if (
-                target.lower() in name_match
-                or target in stats.get("mention", "")
-                or target == mention_match
-            ):
-                # Try to find real member
+        # 2. Is it a player? (ID, mention, or display name)
+        player_entry = await asyncio.to_thread(find_player, target)
+        if player_entry:
+            user_id, stats = player_entry
+            # Looking up yourself needs no guild cache lookup
+            if user_id == str(interaction.user.id):
+                member = interaction.user
+            else:
                 member = interaction.guild.get_member(int(user_id))
-                fake_user = discord.Object(id=int(user_id)) if not member else member
-                # Set display_name for fake_user if member not found
-                if not member and hasattr(stats, 'get'):
-                    fake_user.display_name = stats.get("display_name", f"Player {user_id}")
-                embed = build_stats_embed(fake_user, stats, interaction.guild)
-                await interaction.response.send_message(embed=embed, ephemeral=True)
-                return
+            fake_user = discord.Object(id=int(user_id)) if not member else member
+            # Set display_name for fake_user if member not found
+            if not member and hasattr(stats, 'get'):
+                fake_user.display_name = stats.get("display_name", f"Player {user_id}")
+            embed = build_stats_embed(fake_user, stats, interaction.guild)
+            await interaction.followup.send(embed=embed, ephemeral=True)
+            return
 
         # 3. Is it a team name?
         team_data = tournament.get("teams", {}).get(target)
@@ -617,20 +723,20 @@ class InfoGroup(app_commands.Group):
                 embed.add_field(name="🎯 Matches Played", value=matches_played, inline=True)
                 embed.set_footer(text="Tournament Evaluation")
 
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=embed, ephemeral=True)
             return
 
         # 4. Nothing found
-        await interaction.response.send_message(get_message("ERRORS", "player_not_found"), ephemeral=True)
+        await interaction.followup.send(get_message("ERRORS", "player_not_found"), ephemeral=True)
 
 
     @app_commands.command(name="tournament", description="Shows the current tournament status.")
     async def status(self, interaction: Interaction):
         """Displays current tournament status."""
-        tournament = load_tournament_data()
+        tournament = load_tournament_data(readonly=True)
 
         # Get timezone from config and use timezone-aware datetime
-        tz = ZoneInfo(CONFIG.bot.timezone)
+        tz = get_bot_timezone()
         now = datetime.now(tz=tz)
 
         registration_open = tournament.get("registration_open", False)
@@ -644,21 +750,15 @@ class InfoGroup(app_commands.Group):
         # Prepare placeholders
         registration_text = "Currently closed."
         if registration_open and registration_end:
-            reg_end = datetime.fromisoformat(registration_end)
-            # Ensure timezone awareness
-            if reg_end.tzinfo is None:
-                reg_end = reg_end.replace(tzinfo=tz)
+            reg_end = parse_iso_datetime(registration_end)
             registration_text = f"Open until {reg_end.strftime('%d.%m.%Y %H:%M')}"
 
         tournament_text = "No active tournament."
         if tournament_running and tournament_end:
-            tourn_end = datetime.fromisoformat(tournament_end)
-            # Ensure timezone awareness
-            if tourn_end.tzinfo is None:
-                tourn_end = tourn_end.replace(tzinfo=tz)
-            delta = tourn_end - now
-            days = delta.days
-            hours = delta.seconds // 3600
+            tourn_end = parse_iso_datetime(tournament_end)
+            remaining_seconds = int((tourn_end - now).total_seconds())
+            days, remainder = divmod(remaining_seconds, 86400)
+            hours = remainder // 3600
             tournament_text = f"Running – ends in {days} days, {hours} hours"
 
         placeholders = {
@@ -675,7 +775,7 @@ class InfoGroup(app_commands.Group):
         """Displays the current tournament match schedule."""
         from modules.matchmaker import generate_schedule_overview
 
-        tournament = load_tournament_data()
+        tournament = load_tournament_data(readonly=True)
 
         if not tournament.get("running", False):
             await interaction.response.send_message(
@@ -704,7 +804,7 @@ class InfoGroup(app_commands.Group):
         """
         Lists all current participants (teams and solo players), sorted alphabetically.
         """
-        tournament = load_tournament_data()
+        tournament = load_tournament_data(readonly=True)
 
         teams = tournament.get("teams", {})
         solo = tournament.get("solo", [])
@@ -800,7 +900,7 @@ async def stats_autocomplete(interaction: Interaction, current: str):
             choices.append(app_commands.Choice(name=choice_name, value=display_name))
 
     # Add teams
-    tournament = load_tournament_data()
+    tournament = load_tournament_data(readonly=True)
     teams = tournament.get("teams", {})
     for team_name in list(teams.keys())[:10]:  # Limit teams too
         if current.lower() in team_name.lower():
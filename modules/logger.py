@@ -54,6 +54,9 @@ def setup_logger(log_folder="logs", level=logging.INFO):
     if logger.hasHandlers():
         logger.handlers.clear()
 
+    # Our handlers are attached here, don't hand records to the root logger as well
+    logger.propagate = False
+
     # FileHandler
     file_handler = logging.FileHandler(log_file, encoding="utf-8")
     file_handler.setLevel(level)
@@ -23,7 +23,8 @@ from modules.dataStorage import (
 )
 from modules.logger import logger
 from modules.reminder import match_reminder_loop
-from modules.task_manager import add_task, cancel_all_tasks
+from modules.stats_tracker import flush_now
+from modules.task_manager import add_task, cancel_all_tasks, get_all_tasks
 
 # Important
 load_env()
@@ -38,6 +39,9 @@ intents.members = True
 
 bot = commands.Bot(command_prefix="!", intents=intents)
 
+# on_ready fires again after every reconnect, the tasks started by the first one keep running
+_ready_once = False
+
 EXTENSIONS = [
     "modules.setup",
     "modules.players",
@@ -52,6 +56,7 @@ EXTENSIONS = [
 # ========== EVENTS ==========
 @bot.event
 async def on_ready():
+    global _ready_once
     language = CONFIG.bot.language.lower()
 
     logger.info("═" * 70)
@@ -235,13 +240,16 @@ async def on_ready():
         if DEBUG_MODE:
             logger.error(f"[STARTUP] ⚠️ Error checking tournament status: {e}")
 
-    # Stop old tasks
-    try:
-        cancel_all_tasks()
-        if DEBUG_MODE:
-            logger.debug("[STARTUP] ✅ Old background tasks terminated")
-    except Exception as e:
-        logger.error(f"[STARTUP] ⚠️ Error terminating old tasks: {e}")
+    # Stop old tasks (first start only: after a reconnect the running timers are still valid,
+    # e.g. the poll end can't be recovered from the tournament data)
+    if not _ready_once:
+        try:
+            cancel_all_tasks()
+            if DEBUG_MODE:
+                logger.debug("[STARTUP] ✅ Old background tasks terminated")
+        except Exception as e:
+            logger.error(f"[STARTUP] ⚠️ Error terminating old tasks: {e}")
+    _ready_once = True
 
     # Start reminder system
     try:
@@ -315,6 +323,48 @@ async def on_ready():
     except Exception as e:
         logger.error(f"[STARTUP] ❌ Failed to recover reschedule timers: {e}")
 
+    # Recover registration close / tournament end timers after bot restart
+    # (the deadlines are stored in the tournament data, only the sleeping tasks are lost)
+    try:
+        from modules.utils import parse_iso_datetime, now_in_bot_timezone
+
+        def has_live_task(name: str) -> bool:
+            entry = get_all_tasks().get(name)
+            return entry is not None and not entry.task.done()
+
+        tournament_data = load_tournament_data(readonly=True)
+        channel = bot.get_channel(CONFIG.get_channel_id("reminder"))
+
+        if tournament_data.get("running") and channel:
+            now = now_in_bot_timezone()
+
+            if has_live_task("close_registration") or has_live_task("tournament_end_timer"):
+                # Reconnect: the timer from before is still sleeping, replacing it would only race its cancel
+                logger.debug("[STARTUP] ℹ️  Tournament timer still active, nothing to recover")
+
+            elif tournament_data.get("registration_open") and tournament_data.get("registration_end"):
+                registration_end = parse_iso_datetime(tournament_data["registration_end"])
+                delay_seconds = max(0, int((registration_end - now).total_seconds()))
+                add_task(
+                    "close_registration",
+                    bot.loop.create_task(tournament.close_registration_after_delay(delay_seconds, channel)),
+                )
+                logger.info(f"[STARTUP] ⏱️  Recovered registration close ({delay_seconds / 3600:.1f}h remaining)")
+
+            # Matches only exist once registration closed, saved together with the real end date.
+            # Before that (poll phase) tournament_end is still the 12-week placeholder
+            elif tournament_data.get("matches") and tournament_data.get("tournament_end"):
+                tournament_end = parse_iso_datetime(tournament_data["tournament_end"])
+                delay_seconds = max(0, int((tournament_end - now).total_seconds()))
+                add_task(
+                    "tournament_end_timer",
+                    bot.loop.create_task(tournament.close_tournament_after_delay(delay_seconds, channel)),
+                )
+                logger.info(f"[STARTUP] ⏱️  Recovered tournament end timer ({delay_seconds / 86400:.1f} days remaining)")
+
+    except Exception as e:
+        logger.error(f"[STARTUP] ❌ Failed to recover tournament timers: {e}")
+
     # Resync slash commands
     try:
         synced = await bot.tree.sync()
@@ -410,6 +460,11 @@ async def main():
         logger.critical("[SYSTEM] ❌ CRITICAL: Privileged intents required - enable them in Discord Developer Portal!")
     except Exception as e:
         logger.critical(f"[SYSTEM] ❌ CRITICAL: Bot crashed during startup: {e}")
+    finally:
+        # Write back any player stats still held in the write-back cache
+        written = await flush_now()
+        if written:
+            logger.info(f"[SYSTEM] 💾 Flushed {written} pending player stats on shutdown")
 
 
 if __name__ == "__main__":
@@ -51,7 +51,7 @@ def _update_tournament_end_timer(new_end: datetime):
     # Cancel existing tournament_end_timer if it exists
     all_tasks = get_all_tasks()
     if "tournament_end_timer" in all_tasks:
-        old_task = all_tasks["tournament_end_timer"]["task"]
+        old_task = all_tasks["tournament_end_timer"].task
         if not old_task.done():
             old_task.cancel()
             logger.info("[EXTEND] ⏰ Cancelled old tournament end timer")
@@ -71,13 +71,18 @@ def _update_tournament_end_timer(new_end: datetime):
 # TEAM MANAGEMENT FUNCTIONS
 # =======================================
 
-def auto_match_solo():
+def auto_match_solo(tournament: dict = None):
     """
     Pairs solo players based on common availability for Saturday/Sunday.
     Only saves working teams.
+
+    :param tournament: Tournament data to update in place, the caller saves it.
+                       If omitted, it is loaded and saved here.
     """
-    tournament = load_tournament_data()
-    solo_players = tournament.get("solo", [])
+    save = tournament is None
+    if save:
+        tournament = load_tournament_data()
+    solo_players = list(tournament.get("solo", []))
 
     if len(solo_players) < 2:
         logger.info("[MATCHMAKER] Not enough solo players to pair.")
@@ -160,7 +165,8 @@ def auto_match_solo():
     if new_teams:
         tournament.setdefault("teams", {}).update(new_teams)
         tournament["solo"] = solo_players
-        save_tournament_data(tournament)
+        if save:
+            save_tournament_data(tournament)
         logger.info(f"[MATCHMAKER] ✅ {len(new_teams)} teams created: {', '.join(new_teams.keys())}")
     else:
         logger.warning("[MATCHMAKER] ❌ No teams created – nothing saved.")
@@ -168,12 +174,18 @@ def auto_match_solo():
     return list(new_teams.keys())
 
 
-async def cleanup_orphan_teams(channel: TextChannel):
+async def cleanup_orphan_teams(channel: TextChannel, tournament: dict = None):
     """
     Removes teams with only 1 player after registration close
     and moves them to the solo list.
+
+    :param channel: Tournament channel
+    :param tournament: Tournament data to update in place, the caller saves it.
+                       If omitted, it is loaded and saved here.
     """
-    tournament = load_tournament_data()
+    save = tournament is None
+    if save:
+        tournament = load_tournament_data()
     teams = tournament.get("teams", {})
     solo = tournament.get("solo", [])
 
@@ -198,7 +210,8 @@ async def cleanup_orphan_teams(channel: TextChannel):
 
     tournament["teams"] = teams
     tournament["solo"] = solo
-    save_tournament_data(tournament)
+    if save:
+        save_tournament_data(tournament)
 
     # Log cleanup results (no channel spam)
     if teams_deleted_list:
@@ -212,9 +225,12 @@ async def cleanup_orphan_teams(channel: TextChannel):
 # SCHEDULE GENERATION FUNCTIONS
 # =======================================
 
-def create_round_robin_schedule(tournament: dict):
+def create_round_robin_schedule(tournament: dict, save: bool = True):
     """
     Creates a round-robin schedule based on the current teams.
+
+    :param tournament: Tournament data, its "matches" are replaced
+    :param save: Save the tournament data afterwards
     """
     teams = list(tournament.get("teams", {}).keys())
 
@@ -238,7 +254,8 @@ def create_round_robin_schedule(tournament: dict):
         match_id += 1
 
     tournament["matches"] = matches
-    save_tournament_data(tournament)
+    if save:
+        save_tournament_data(tournament)
 
     logger.info(f"[MATCHMAKER] {len(matches)} matches created for {len(teams)} teams.")
     return matches
@@ -773,14 +790,18 @@ def assign_rescue_slots(unassigned_matches, matches, slot_matrix, teams):
 # MAIN ENTRY POINT
 # =======================================
 
-async def generate_and_assign_slots():
+async def generate_and_assign_slots(tournament: dict = None):
     """
     Main function for slot generation and match assignment.
     Uses global slot matrix and new assignment logic.
 
     Enhanced with automatic tournament extension when rescue mode fails due to capacity.
+
+    :param tournament: Tournament data the caller just saved, updated in place and saved here.
+                       If omitted, it is loaded from disk.
     """
-    tournament = load_tournament_data()
+    if tournament is None:
+        tournament = load_tournament_data()
     matches = tournament.get("matches", [])
     teams = tournament.get("teams", {})
 
@@ -871,8 +892,7 @@ async def generate_and_assign_slots():
 
             logger.info(f"[EXTEND] 🔄 Regenerating slot matrix with new end date...")
 
-            # Reload tournament and regenerate slot matrix
-            tournament = load_tournament_data()
+            # Regenerate slot matrix (the in-memory data is what was just saved, no reload needed)
             slot_matrix = generate_slot_matrix(tournament, log_prefix="EXTEND-MATRIX")
 
             # Retry failed matches with expanded slot matrix
@@ -125,10 +125,8 @@ async def end_poll(bot: discord.Client, channel: discord.TextChannel):
             chosen_game_name = "No games available"
             logger.error("[POLL] ❌ No games available – poll empty")
     else:
-        sorted_votes = sorted(real_votes.items(), key=lambda kv: kv[1], reverse=True)
-        max_votes = sorted_votes[0][1]
-        top_options = [option for option, votes in sorted_votes if votes == max_votes]
-        chosen_game_id = top_options[0]  # This is the game ID (e.g., "Gates_of_Hell")
+        # max() keeps the first option on ties, same as the stable sort did
+        chosen_game_id = max(real_votes, key=real_votes.get)  # This is the game ID (e.g., "Gates_of_Hell")
 
         # Convert game ID to display name
         chosen_game_name = all_games.get(chosen_game_id, {}).get("name", chosen_game_id)
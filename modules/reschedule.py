@@ -2,7 +2,6 @@
 
 import asyncio
 import logging
-import re
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
@@ -25,6 +24,7 @@ from modules.logger import logger
 from modules.matchmaker import generate_slot_matrix, get_valid_slots_for_match, assign_slots_with_matrix
 from modules.task_manager import add_task, get_all_tasks
 from modules.utils import (
+    extract_user_id,
     get_player_team,
     get_team_open_matches,
     smart_send,
@@ -71,19 +71,6 @@ def get_reschedule_pending_matches() -> list:
     return [m for m in tournament.get("matches", []) if m.get("reschedule_pending")]
 
 
-# ---------------------------------------
-# Helper: Extract IDs
-# ---------------------------------------
-def extract_ids(members):
-    """Extracts user IDs from mention strings."""
-    ids = []
-    for m in members:
-        match = re.search(r"\d+", m)
-        if match:
-            ids.append(match.group(0))
-    return ids
-
-
 def get_free_slots_for_match(tournament, match_id: int) -> list[datetime]:
     """
     Returns all allowed and free slots for a specific match.
@@ -367,7 +354,6 @@ async def handle_request_reschedule(interaction: Interaction, match_id: int):
         mentions = members1 + members2
 
         # Fetch valid members
-        from modules.utils import extract_user_id
         valid_members = []
         for mention in mentions:
             try:
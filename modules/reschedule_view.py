@@ -142,7 +142,7 @@ class RescheduleView(ui.View):
             task_name = f"reschedule_timer_match_{self.match_id}"
             all_tasks = get_all_tasks()
             if task_name in all_tasks:
-                timer_task = all_tasks[task_name]["task"]
+                timer_task = all_tasks[task_name].task
                 if not timer_task.done():
                     timer_task.cancel()
                     logger.debug(f"[RESCHEDULE] Cancelled timer task for match {self.match_id} after decline")
@@ -316,7 +316,7 @@ class RescheduleView(ui.View):
             task_name = f"reschedule_timer_match_{self.match_id}"
             all_tasks = get_all_tasks()
             if task_name in all_tasks:
-                timer_task = all_tasks[task_name]["task"]
+                timer_task = all_tasks[task_name].task
                 if not timer_task.done():
                     timer_task.cancel()
                     logger.debug(f"[RESCHEDULE] Cancelled timer task for match {self.match_id} after success")
@@ -9,14 +9,27 @@ Handles advanced player statistics including:
 - Tournament participation timeline
 """
 
+import asyncio
+import heapq
 import os
-import json
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
-from modules.dataStorage import load_global_data, save_global_data, load_tournament_data
+from modules.dataStorage import (
+    DEBUG_MODE,
+    json_dumps,
+    json_loads,
+    load_global_data,
+    save_global_data,
+    load_tournament_data,
+)
 from modules.logger import logger
 from modules.config import CONFIG
 from modules.embeds import load_embed_template
+from modules.utils import now_in_bot_timezone
 
 # Player stats directory
 PLAYER_STATS_DIR = os.path.join(os.path.dirname(__file__), "..", "data", "player_stats")
@@ -24,6 +37,22 @@ PLAYER_STATS_DIR = os.path.join(os.path.dirname(__file__), "..", "data", "player
 # Ensure directory exists
 os.makedirs(PLAYER_STATS_DIR, exist_ok=True)
 
+# Worker threads used to load/save many independent player files at once
+STATS_IO_WORKERS = 16
+
+# Bumped on every write/delete so readers can tell if cached aggregates are stale
+_stats_version = 0
+
+
+def get_stats_version() -> int:
+    """
+    Returns a counter that changes whenever a player stats file is written or deleted
+    by this process.
+
+    :return: Current stats version
+    """
+    return _stats_version
+
 
 def initialize_player_stats(user_id: str, mention: str = None, display_name: str = None) -> Dict:
     """
@@ -55,6 +84,9 @@ def initialize_player_stats(user_id: str, mention: str = None, display_name: str
 
         # Head-to-head records
         "head_to_head": {},
+        # Opponent IDs of the current nemesis/rival, kept up to date while recording matches
+        "nemesis": None,
+        "rival": None,
 
         # Streaks
         "streaks": {
@@ -92,20 +124,41 @@ def load_player_stats(user_id: str) -> Optional[Dict]:
         return None
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            stats = json.load(f)
+        with open(file_path, 'rb') as f:
+            stats = json_loads(f.read())
         return stats
     except Exception as e:
         logger.error(f"[STATS] Error loading stats for user {user_id}: {e}")
         return None
 
 
-def save_player_stats(user_id: str, stats: Dict) -> bool:
+def save_player_stats(user_id: str, stats: Dict, durable: bool = False) -> bool:
     """
     Save player statistics to individual file atomically using tempfile + rename.
+    The rename alone keeps readers from seeing a torn file; durable additionally
+    fsyncs the data so it survives a crash or power loss.
 
     :param user_id: Discord user ID
     :param stats: Player stats dictionary
+    :param durable: fsync the file before replacing the old one
+    :return: True if successful, False otherwise
+    """
+    try:
+        # Compact JSON unless debugging, nobody reads these files by hand on the hot path
+        data = json_dumps(stats, pretty=DEBUG_MODE)
+    except Exception as e:
+        logger.error(f"[STATS] Error saving stats for user {user_id}: {e}")
+        return False
+    return _write_stats_file(user_id, data, durable)
+
+
+def _write_stats_file(user_id: str, data: bytes, durable: bool = False) -> bool:
+    """
+    Atomically writes already serialized player stats (see save_player_stats).
+
+    :param user_id: Discord user ID
+    :param data: Serialized player stats
+    :param durable: fsync the file before replacing the old one
     :return: True if successful, False otherwise
     """
     import tempfile
@@ -119,20 +172,22 @@ def save_player_stats(user_id: str, stats: Dict) -> bool:
 
     try:
         # Write to temporary file first (atomic operation)
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            encoding='utf-8',
-            dir=PLAYER_STATS_DIR,
-            delete=False,
-            suffix='.tmp'
-        ) as tmp_file:
-            json.dump(stats, tmp_file, indent=2, ensure_ascii=False)
-            tmp_file.flush()
-            os.fsync(tmp_file.fileno())
-            tmp_path = tmp_file.name
+        # Raw fd writes, the bytes are ready so no buffered file object is needed
+        fd, tmp_path = tempfile.mkstemp(dir=PLAYER_STATS_DIR, suffix='.tmp')
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            if durable:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
 
         # Atomic rename (replaces old file)
         os.replace(tmp_path, file_path)
+
+        global _stats_version
+        _stats_version += 1
         return True
     except Exception as e:
         logger.error(f"[STATS] Error saving stats for user {user_id}: {e}")
@@ -167,18 +222,44 @@ def delete_player_stats(user_id: str) -> bool:
     try:
         os.remove(file_path)
         logger.info(f"[STATS] Deleted stats for user {user_id}")
+
+        global _stats_version
+        _stats_version += 1
         return True
     except Exception as e:
         logger.error(f"[STATS] Error deleting stats for user {user_id}: {e}")
         return False
 
 
+def load_many_player_stats(user_ids: List[str]) -> Dict[str, Optional[Dict]]:
+    """
+    Load the stats of several players in parallel. The files are independent,
+    so the per-file open/read latency overlaps instead of adding up.
+
+    :param user_ids: Discord user IDs
+    :return: Dict mapping user ID -> stats dictionary (None if the player has no file)
+    """
+    user_ids = list(user_ids)
+    if len(user_ids) <= 1:
+        return {user_id: load_player_stats(user_id) for user_id in user_ids}
+
+    with ThreadPoolExecutor(max_workers=min(STATS_IO_WORKERS, len(user_ids))) as pool:
+        return dict(zip(user_ids, pool.map(load_player_stats, user_ids)))
+
+
+# (directory mtime_ns, player IDs) of the last listing
+_player_list_cache: Optional[tuple] = None
+
+
 def list_all_players() -> List[str]:
     """
     Get list of all player IDs with stats files.
+    The listing is cached until the directory's mtime changes.
 
     :return: List of user IDs
     """
+    global _player_list_cache
+
     try:
         # Check if directory exists before listing
         if not os.path.exists(PLAYER_STATS_DIR):
@@ -186,9 +267,19 @@ def list_all_players() -> List[str]:
             os.makedirs(PLAYER_STATS_DIR, exist_ok=True)
             return []
 
-        files = os.listdir(PLAYER_STATS_DIR)
-        player_ids = [f.replace('.json', '') for f in files if f.endswith('.json')]
-        return player_ids
+        # Creating, replacing or deleting a file changes the directory mtime
+        dir_mtime = os.stat(PLAYER_STATS_DIR).st_mtime_ns
+        if _player_list_cache and _player_list_cache[0] == dir_mtime:
+            return list(_player_list_cache[1])
+
+        with os.scandir(PLAYER_STATS_DIR) as entries:
+            player_ids = [
+                entry.name[:-5]
+                for entry in entries
+                if entry.name.endswith('.json') and entry.is_file(follow_symlinks=False)
+            ]
+        _player_list_cache = (dir_mtime, player_ids)
+        return list(player_ids)
     except PermissionError as e:
         logger.error(f"[STATS] Permission denied when accessing stats directory: {e}")
         return []
@@ -197,132 +288,347 @@ def list_all_players() -> List[str]:
         return []
 
 
-def record_match_result(winner_ids: List[str], loser_ids: List[str], game: str,
-                       winner_mentions: List[str] = None, loser_mentions: List[str] = None,
-                       winner_names: List[str] = None, loser_names: List[str] = None):
+# ----------------------------------------
+# Write-back cache
+# ----------------------------------------
+# Player stats loaded for an update stay here until flush_stats() writes the dirty ones back,
+# so a player touched several times in one update pass is loaded and saved only once.
+# The lock lets flush_stats() run in a worker thread while the event loop records new results.
+_write_cache: Dict[str, Dict] = {}
+_dirty: set = set()
+_cache_lock = threading.RLock()
+# One flush writes at a time, so an older snapshot never lands after a newer one
+_flush_lock = threading.Lock()
+
+# Open player_stats_batch() blocks; while > 0 the update functions leave flushing to the batch
+_batch_depth = 0
+_batch_durable = False
+
+# Delay before a scheduled flush runs, so results reported close together share one write
+SAVE_DEBOUNCE_SECONDS = 0.25
+_flush_task: Optional[asyncio.Task] = None
+
+
+def _get_for_update(user_id: str, mention: str = None, display_name: str = None) -> Dict:
     """
-    Record the result of a single match and update all relevant statistics.
-    Uses individual player files for storage.
+    Returns the live stats dict of a player for modification, loading it on first access.
+    Head-to-head "games" lists are turned into sets while the dict is cached.
+
+    :param user_id: Discord user ID as string
+    :param mention: Mention used if the player has no stats yet
+    :param display_name: Display name used if the player has no stats yet
+    :return: Player stats dictionary (cached, changes must be followed by _mark_dirty)
+        Callers must hold _cache_lock while modifying it.
+    """
+    stats = _write_cache.get(user_id)
+    if stats is None:
+        stats = _cache_for_update(user_id, load_player_stats(user_id), mention, display_name)
+    return stats
 
-    :param winner_ids: List of winner user IDs
-    :param loser_ids: List of loser user IDs
-    :param game: Game name
-    :param winner_mentions: Optional list of winner mentions
-    :param loser_mentions: Optional list of loser mentions
-    :param winner_names: Optional list of winner display names
-    :param loser_names: Optional list of loser display names
+
+def _cache_for_update(user_id: str, stats: Optional[Dict], mention: str = None,
+                      display_name: str = None) -> Dict:
+    """Puts loaded (or freshly initialized) stats into the write-back cache."""
+    if stats is None:
+        stats = initialize_player_stats(user_id, mention, display_name)
+    # Sets make the per-match game dedup O(1), converted back to lists on flush
+    h2h = stats["head_to_head"]
+    for record in h2h.values():
+        record["games"] = set(record.get("games", []))
+    # Files written before nemesis/rival were stored get them computed once here
+    if "rival" not in stats:
+        stats["nemesis"] = max(h2h, key=lambda opponent: _nemesis_score(h2h[opponent]), default=None)
+        stats["rival"] = max(h2h, key=lambda opponent: _rival_score(h2h[opponent]), default=None)
+    _write_cache[user_id] = stats
+    return stats
+
+
+def _prefetch_for_update(user_ids: List[str]) -> None:
     """
-    # Process winners
-    for idx, user_id in enumerate(winner_ids):
-        uid_str = str(user_id)
+    Loads all given players that are not cached yet in one parallel pass,
+    so the following _get_for_update calls are cache hits.
 
-        # Load or initialize stats
-        stats = load_player_stats(uid_str)
-        if stats is None:
-            mention = winner_mentions[idx] if winner_mentions and idx < len(winner_mentions) else None
-            name = winner_names[idx] if winner_names and idx < len(winner_names) else None
-            stats = initialize_player_stats(uid_str, mention, name)
+    :param user_ids: Discord user IDs as strings
+    """
+    missing = [user_id for user_id in dict.fromkeys(user_ids) if user_id not in _write_cache]
+    for user_id, stats in load_many_player_stats(missing).items():
+        _cache_for_update(user_id, stats)
 
-        # Update match stats
-        stats["match_stats"]["total_matches"] += 1
-        stats["match_stats"]["match_wins"] += 1
 
-        # Update per-game stats
-        if game not in stats["game_stats"]:
-            stats["game_stats"][game] = {
-                "matches": 0,
-                "wins": 0,
-                "losses": 0,
-                "tournaments": 0
-            }
-        stats["game_stats"][game]["matches"] += 1
-        stats["game_stats"][game]["wins"] += 1
+def _mark_dirty(user_id: str) -> None:
+    """Marks a cached player as modified so flush_stats() writes it."""
+    _dirty.add(user_id)
+
 
-        # Update streaks (win)
-        if stats["streaks"]["current_type"] == "win":
-            stats["streaks"]["current"] += 1
+def _serialize_for_flush(stats: Dict) -> bytes:
+    """
+    Serializes a cached stats dict without touching it (head-to-head game sets become sorted lists).
+    Caller must hold _cache_lock.
+    """
+    h2h = {
+        opponent: {**record, "games": sorted(record["games"])}
+        for opponent, record in stats["head_to_head"].items()
+    }
+    return json_dumps({**stats, "head_to_head": h2h}, pretty=DEBUG_MODE)
+
+
+def flush_stats(durable: bool = False) -> int:
+    """
+    Writes all modified player stats from the write-back cache to disk and evicts them from the cache.
+    The cache lock is only held to snapshot the dirty players, not during the disk writes,
+    so updates on the event loop don't wait for a flush running in a worker thread.
+
+    :param durable: fsync every written file (see save_player_stats)
+    :return: Number of player files written
+    """
+    with _flush_lock:
+        # The serialized bytes are the snapshot, later changes to the cached dicts don't affect them
+        with _cache_lock:
+            snapshot = [(user_id, _serialize_for_flush(_write_cache[user_id])) for user_id in _dirty]
+            _dirty.clear()
+
+        # Every player has its own file, so the saves can run side by side
+        if len(snapshot) > 1:
+            with ThreadPoolExecutor(max_workers=min(STATS_IO_WORKERS, len(snapshot))) as pool:
+                results = list(pool.map(lambda item: _write_stats_file(item[0], item[1], durable), snapshot))
         else:
-            stats["streaks"]["current"] = 1
-            stats["streaks"]["current_type"] = "win"
-
-        if stats["streaks"]["current"] > stats["streaks"]["best_win"]:
-            stats["streaks"]["best_win"] = stats["streaks"]["current"]
-
-        # Update head-to-head vs losers
-        for loser_id in loser_ids:
-            loser_str = str(loser_id)
-            if loser_str not in stats["head_to_head"]:
-                stats["head_to_head"][loser_str] = {
-                    "wins": 0,
-                    "losses": 0,
-                    "games": []
-                }
-            stats["head_to_head"][loser_str]["wins"] += 1
-            if game not in stats["head_to_head"][loser_str]["games"]:
-                stats["head_to_head"][loser_str]["games"].append(game)
-
-        # Update timeline
-        stats["timeline"]["last_game"] = game
-
-        # Save individual player stats
-        save_player_stats(uid_str, stats)
-
-    # Process losers
-    for idx, user_id in enumerate(loser_ids):
-        uid_str = str(user_id)
-
-        # Load or initialize stats
-        stats = load_player_stats(uid_str)
-        if stats is None:
-            mention = loser_mentions[idx] if loser_mentions and idx < len(loser_mentions) else None
-            name = loser_names[idx] if loser_names and idx < len(loser_names) else None
-            stats = initialize_player_stats(uid_str, mention, name)
+            results = [_write_stats_file(user_id, data, durable) for user_id, data in snapshot]
 
-        # Update match stats
-        stats["match_stats"]["total_matches"] += 1
-        stats["match_stats"]["match_losses"] += 1
+        with _cache_lock:
+            # Failed writes stay dirty for the next flush
+            _dirty.update(user_id for (user_id, _), ok in zip(snapshot, results) if not ok)
+            # Players changed during the write stay cached (and dirty), the rest is on disk now.
+            # Written players were kept cached until now so nobody reloaded the old file meanwhile
+            for user_id in [user_id for user_id in _write_cache if user_id not in _dirty]:
+                del _write_cache[user_id]
+    return sum(results)
 
-        # Update per-game stats
-        if game not in stats["game_stats"]:
-            stats["game_stats"][game] = {
-                "matches": 0,
+
+def _flush_unless_batched(durable: bool = False) -> None:
+    """
+    Flushes the write-back cache right away, or leaves it to the enclosing
+    player_stats_batch() (remembering whether a durable write was requested).
+
+    :param durable: fsync the written files (see save_player_stats)
+    """
+    global _batch_durable
+    with _cache_lock:
+        if _batch_depth:
+            _batch_durable = _batch_durable or durable
+            return
+    flush_stats(durable=durable)
+
+
+@contextmanager
+def player_stats_batch():
+    """
+    Groups several stats updates so that players touched by more than one of them
+    are loaded and saved only once, when the outermost batch exits.
+
+    Example:
+        with player_stats_batch():
+            update_tournament_participation(ids, game)
+            update_tournament_wins(winner_ids)
+    """
+    global _batch_depth, _batch_durable
+    with _cache_lock:
+        _batch_depth += 1
+    try:
+        yield
+    finally:
+        with _cache_lock:
+            _batch_depth -= 1
+            outermost = _batch_depth == 0
+            durable = _batch_durable
+            if outermost:
+                _batch_durable = False
+        if outermost:
+            flush_stats(durable=durable)
+
+
+async def _flush_after(delay: float) -> None:
+    """Waits for the debounce window, then flushes the write-back cache in a worker thread."""
+    await asyncio.sleep(delay)
+    try:
+        written = await asyncio.to_thread(flush_stats)
+        logger.debug("[STATS] Scheduled flush wrote %d player file(s)", written)
+    except Exception as e:
+        logger.error(f"[STATS] Scheduled stats flush failed: {e}")
+
+
+def schedule_flush(delay: float = SAVE_DEBOUNCE_SECONDS) -> None:
+    """
+    Schedules a background flush of the write-back cache. Calls made while a flush is
+    already pending are coalesced into that flush. Must be called from the event loop.
+
+    :param delay: Debounce window in seconds
+    """
+    global _flush_task
+    if _flush_task is None or _flush_task.done():
+        _flush_task = asyncio.get_running_loop().create_task(_flush_after(delay))
+
+
+async def flush_now() -> int:
+    """
+    Cancels a pending scheduled flush and durably writes all dirty player stats immediately.
+
+    :return: Number of player files written
+    """
+    global _flush_task
+    if _flush_task is not None and not _flush_task.done():
+        _flush_task.cancel()
+    _flush_task = None
+    return await asyncio.to_thread(flush_stats, True)
+
+
+# Keys touched by _apply_match_to_player for each side:
+# (streak type, match_stats counter, game/head-to-head counter, best streak)
+_WIN_KEYS = ("win", "match_wins", "wins", "best_win")
+_LOSS_KEYS = ("loss", "match_losses", "losses", "best_loss")
+
+
+def _apply_match_to_player(stats: Dict, opponent_ids: List[str], game: str, won: bool) -> None:
+    """
+    Apply a single match result to a player's stats dict in place.
+
+    :param stats: Player stats dictionary
+    :param opponent_ids: User IDs (as strings) of the opposing team
+    :param game: Game name
+    :param won: True if this player was on the winning side
+    """
+    # Resolve all side-dependent keys once
+    if won:
+        streak_type, match_key, count_key, best_key = _WIN_KEYS
+    else:
+        streak_type, match_key, count_key, best_key = _LOSS_KEYS
+
+    # Update match stats
+    match_stats = stats["match_stats"]
+    match_stats["total_matches"] += 1
+    match_stats[match_key] += 1
+
+    # Update per-game stats
+    game_entry = stats["game_stats"].setdefault(game, {
+        "matches": 0,
+        "wins": 0,
+        "losses": 0,
+        "tournaments": 0
+    })
+    game_entry["matches"] += 1
+    game_entry[count_key] += 1
+
+    # Update streaks
+    streaks = stats["streaks"]
+    if streaks["current_type"] == streak_type:
+        streaks["current"] += 1
+    else:
+        streaks["current"] = 1
+        streaks["current_type"] = streak_type
+
+    if streaks["current"] > streaks[best_key]:
+        streaks[best_key] = streaks["current"]
+
+    # Update head-to-head vs opponents ("games" is a set while in memory, see record_match_results_bulk)
+    head_to_head = stats["head_to_head"]
+    for opponent_id in opponent_ids:
+        record = head_to_head.get(opponent_id)
+        if record is None:
+            record = head_to_head[opponent_id] = {
                 "wins": 0,
                 "losses": 0,
-                "tournaments": 0
+                "games": set()
             }
-        stats["game_stats"][game]["matches"] += 1
-        stats["game_stats"][game]["losses"] += 1
+        record[count_key] += 1
+        record["games"].add(game)
 
-        # Update streaks (loss)
-        if stats["streaks"]["current_type"] == "loss":
-            stats["streaks"]["current"] += 1
-        else:
-            stats["streaks"]["current"] = 1
-            stats["streaks"]["current_type"] = "loss"
+        # Counts only ever grow, so comparing the touched record with the current
+        # holder keeps nemesis/rival correct without rescanning all opponents
+        _update_top_opponent(stats, "rival", opponent_id, record, _rival_score)
+        if not won:
+            _update_top_opponent(stats, "nemesis", opponent_id, record, _nemesis_score)
 
-        if stats["streaks"]["current"] > stats["streaks"]["best_loss"]:
-            stats["streaks"]["best_loss"] = stats["streaks"]["current"]
+    # Update timeline
+    stats["timeline"]["last_game"] = game
 
-        # Update head-to-head vs winners
-        for winner_id in winner_ids:
-            winner_str = str(winner_id)
-            if winner_str not in stats["head_to_head"]:
-                stats["head_to_head"][winner_str] = {
-                    "wins": 0,
-                    "losses": 0,
-                    "games": []
-                }
-            stats["head_to_head"][winner_str]["losses"] += 1
-            if game not in stats["head_to_head"][winner_str]["games"]:
-                stats["head_to_head"][winner_str]["games"].append(game)
 
-        # Update timeline
-        stats["timeline"]["last_game"] = game
+def record_match_result(winner_ids: List[str], loser_ids: List[str], game: str,
+                       winner_mentions: List[str] = None, loser_mentions: List[str] = None,
+                       winner_names: List[str] = None, loser_names: List[str] = None,
+                       flush: bool = True):
+    """
+    Record the result of a single match and update all relevant statistics.
+    Uses individual player files for storage.
 
-        # Save individual player stats
-        save_player_stats(uid_str, stats)
+    :param winner_ids: List of winner user IDs
+    :param loser_ids: List of loser user IDs
+    :param game: Game name
+    :param winner_mentions: Optional list of winner mentions
+    :param loser_mentions: Optional list of loser mentions
+    :param winner_names: Optional list of winner display names
+    :param loser_names: Optional list of loser display names
+    :param flush: Write the player files right away; pass False and call schedule_flush()
+                  to keep the disk writes off the event loop
+    """
+    record_match_results_bulk([{
+        "winner_ids": winner_ids,
+        "loser_ids": loser_ids,
+        "winner_mentions": winner_mentions,
+        "loser_mentions": loser_mentions,
+        "winner_names": winner_names,
+        "loser_names": loser_names,
+    }], game, flush=flush)
+
+
+def record_match_results_bulk(results: List[Dict], game: str, flush: bool = True) -> None:
+    """
+    Record several match results, loading and saving each player file only once.
+    Results are applied in order, so streaks behave as if recorded one by one.
 
-    logger.info(f"[STATS] Match result recorded: {len(winner_ids)} winners vs {len(loser_ids)} losers in {game}")
+    :param results: List of dicts with winner_ids, loser_ids and optional
+                    winner_mentions, loser_mentions, winner_names, loser_names
+    :param game: Game name
+    :param flush: Write the player files before returning (see record_match_result)
+    """
+    touched = set()
+
+    with _cache_lock:
+        for result in results:
+            # IDs are normalized to str once here, everything below uses them as-is
+            winner_ids = [str(user_id) for user_id in result.get("winner_ids", [])]
+            loser_ids = [str(user_id) for user_id in result.get("loser_ids", [])]
+            winner_mentions = result.get("winner_mentions") or []
+            loser_mentions = result.get("loser_mentions") or []
+            winner_names = result.get("winner_names") or []
+            loser_names = result.get("loser_names") or []
+
+            for idx, uid_str in enumerate(winner_ids):
+                stats = _get_for_update(
+                    uid_str,
+                    winner_mentions[idx] if idx < len(winner_mentions) else None,
+                    winner_names[idx] if idx < len(winner_names) else None,
+                )
+                _apply_match_to_player(stats, loser_ids, game, won=True)
+                _mark_dirty(uid_str)
+                touched.add(uid_str)
+
+            for idx, uid_str in enumerate(loser_ids):
+                stats = _get_for_update(
+                    uid_str,
+                    loser_mentions[idx] if idx < len(loser_mentions) else None,
+                    loser_names[idx] if idx < len(loser_names) else None,
+                )
+                _apply_match_to_player(stats, winner_ids, game, won=False)
+                _mark_dirty(uid_str)
+                touched.add(uid_str)
+
+            # Lazy %-formatting, this runs once per match and is filtered out unless DEBUG is on
+            logger.debug("[STATS] Match result recorded: %d winners vs %d losers in %s", len(winner_ids), len(loser_ids), game)
+
+    # Write every touched player file once
+    if flush:
+        _flush_unless_batched()
+
+    logger.info(f"[STATS] Recorded {len(results)} match result(s) in {game} for {len(touched)} players")
 
 
 def update_tournament_participation(user_ids: List[str], game: str):
@@ -333,37 +639,37 @@ def update_tournament_participation(user_ids: List[str], game: str):
     :param user_ids: List of all participant user IDs
     :param game: Game that was played
     """
-    from zoneinfo import ZoneInfo
-    timestamp = datetime.now(tz=ZoneInfo(CONFIG.bot.timezone)).isoformat()
+    timestamp = now_in_bot_timezone().isoformat()
 
-    for user_id in user_ids:
-        uid_str = str(user_id)
+    with _cache_lock:
+        _prefetch_for_update([str(user_id) for user_id in user_ids])
 
-        # Load or initialize stats
-        stats = load_player_stats(uid_str)
-        if stats is None:
-            stats = initialize_player_stats(uid_str)
+        for user_id in user_ids:
+            uid_str = str(user_id)
+
+            # Load or initialize stats
+            stats = _get_for_update(uid_str)
 
-        # Update participation count
-        stats["participations"] += 1
+            # Update participation count
+            stats["participations"] += 1
 
-        # Update game tournament count
-        if game not in stats["game_stats"]:
-            stats["game_stats"][game] = {
+            # Update game tournament count
+            game_entry = stats["game_stats"].setdefault(game, {
                 "matches": 0,
                 "wins": 0,
                 "losses": 0,
                 "tournaments": 0
-            }
-        stats["game_stats"][game]["tournaments"] += 1
+            })
+            game_entry["tournaments"] += 1
 
-        # Update timeline
-        if stats["timeline"]["first_tournament"] is None:
-            stats["timeline"]["first_tournament"] = timestamp
-        stats["timeline"]["last_tournament"] = timestamp
+            # Update timeline
+            timeline = stats["timeline"]
+            if timeline["first_tournament"] is None:
+                timeline["first_tournament"] = timestamp
+            timeline["last_tournament"] = timestamp
+            _mark_dirty(uid_str)
 
-        # Save individual player stats
-        save_player_stats(uid_str, stats)
+    _flush_unless_batched()
 
     logger.info(f"[STATS] Tournament participation updated for {len(user_ids)} players")
 
@@ -375,43 +681,80 @@ def update_tournament_wins(winner_ids: List[str]):
 
     :param winner_ids: List of winner user IDs
     """
-    for user_id in winner_ids:
-        uid_str = str(user_id)
+    with _cache_lock:
+        for user_id in winner_ids:
+            uid_str = str(user_id)
 
-        # Load or initialize stats
-        stats = load_player_stats(uid_str)
-        if stats is None:
-            stats = initialize_player_stats(uid_str)
+            # Load or initialize stats
+            stats = _get_for_update(uid_str)
 
-        # Increment tournament wins
-        stats["wins"] += 1
+            # Increment tournament wins
+            stats["wins"] += 1
+            _mark_dirty(uid_str)
 
-        # Save individual player stats
-        save_player_stats(uid_str, stats)
+    # Tournament wins can't be rebuilt from match results, so make sure they hit the disk
+    _flush_unless_batched(durable=True)
 
     logger.info(f"[STATS] Tournament wins updated for {len(winner_ids)} winners")
 
 
-def get_nemesis(user_id: str) -> Optional[Tuple[str, Dict]]:
+def _nemesis_score(record: Dict) -> int:
+    """Losses against an opponent."""
+    return record["losses"]
+
+
+def _rival_score(record: Dict) -> int:
+    """Matches played against an opponent."""
+    return record["wins"] + record["losses"]
+
+
+def _update_top_opponent(stats: Dict, key: str, opponent_id: str, record: Dict, score) -> None:
     """
-    Find the player's nemesis (opponent with most losses against).
-    Uses individual player file.
+    Replaces the stored top opponent (stats[key]) if the given record now scores higher.
 
-    :param user_id: User ID to check
-    :return: Tuple of (opponent_id, stats_dict) or None
+    :param stats: Player stats dictionary
+    :param key: "nemesis" or "rival"
+    :param opponent_id: Opponent whose record just changed
+    :param record: That opponent's head-to-head record
+    :param score: _nemesis_score or _rival_score
     """
-    uid_str = str(user_id)
-    stats = load_player_stats(uid_str)
+    current = stats[key]
+    if current == opponent_id:
+        return
+    if current is None or score(record) > score(stats["head_to_head"][current]):
+        stats[key] = opponent_id
+
 
+def _get_top_opponent(user_id: str, key: str, score, stats: Optional[Dict]) -> Optional[Tuple[str, Dict]]:
+    """
+    Returns the (opponent_id, record) with the highest score, using the stored
+    opponent ID when available and scanning head_to_head for older files.
+    """
     if stats is None:
-        return None
+        stats = load_player_stats(str(user_id))
+        if stats is None:
+            return None
 
     h2h = stats.get("head_to_head", {})
     if not h2h:
         return None
 
-    # Find opponent with most losses
-    nemesis = max(h2h.items(), key=lambda x: x[1]["losses"], default=None)
+    opponent_id = stats.get(key)
+    if opponent_id in h2h:
+        return opponent_id, h2h[opponent_id]
+    return max(h2h.items(), key=lambda x: score(x[1]), default=None)
+
+
+def get_nemesis(user_id: str, stats: Dict = None) -> Optional[Tuple[str, Dict]]:
+    """
+    Find the player's nemesis (opponent with most losses against).
+    Uses individual player file.
+
+    :param user_id: User ID to check
+    :param stats: Already loaded stats of the player, saves loading the file again
+    :return: Tuple of (opponent_id, stats_dict) or None
+    """
+    nemesis = _get_top_opponent(user_id, "nemesis", _nemesis_score, stats)
 
     if nemesis and nemesis[1]["losses"] > 0:
         return nemesis
@@ -419,28 +762,18 @@ def get_nemesis(user_id: str) -> Optional[Tuple[str, Dict]]:
     return None
 
 
-def get_favorite_rival(user_id: str) -> Optional[Tuple[str, Dict]]:
+def get_favorite_rival(user_id: str, stats: Dict = None) -> Optional[Tuple[str, Dict]]:
     """
     Find the player's favorite rival (most matches played against).
     Uses individual player file.
 
     :param user_id: User ID to check
+    :param stats: Already loaded stats of the player, saves loading the file again
     :return: Tuple of (opponent_id, stats_dict) or None
     """
-    uid_str = str(user_id)
-    stats = load_player_stats(uid_str)
+    rival = _get_top_opponent(user_id, "rival", _rival_score, stats)
 
-    if stats is None:
-        return None
-
-    h2h = stats.get("head_to_head", {})
-    if not h2h:
-        return None
-
-    # Find opponent with most total matches
-    rival = max(h2h.items(), key=lambda x: x[1]["wins"] + x[1]["losses"], default=None)
-
-    if rival and (rival[1]["wins"] + rival[1]["losses"]) > 2:  # At least 3 matches
+    if rival and _rival_score(rival[1]) > 2:  # At least 3 matches
         return rival
 
     return None
@@ -494,74 +827,90 @@ def get_top_games(stats: Dict, limit: int = 3) -> List[Tuple[str, Dict]]:
     if not game_stats:
         return []
 
-    # Sort by number of matches played
-    sorted_games = sorted(game_stats.items(), key=lambda x: x[1]["matches"], reverse=True)
+    # Only the top few are needed, no full sort
+    return heapq.nlargest(limit, game_stats.items(), key=lambda x: x[1]["matches"])
+
+
+_DAY = 86400
+
+# Buckets for format_time_since, checked in order:
+# (upper bound in seconds exclusive, seconds per unit or None for fixed text,
+#  singular key, plural key, singular default, plural default)
+_TIME_SINCE_BUCKETS = (
+    (3600, None, "less_than_hour", None, "Less than an hour ago", None),
+    (_DAY, 3600, "hour_singular", "hours_plural", "PLACEHOLDER_COUNT hour ago", "PLACEHOLDER_COUNT hours ago"),
+    (2 * _DAY, None, "yesterday", None, "Yesterday", None),
+    (7 * _DAY, _DAY, "day_singular", "days_plural", "PLACEHOLDER_COUNT day ago", "PLACEHOLDER_COUNT days ago"),
+    (30 * _DAY, 7 * _DAY, "week_singular", "weeks_plural", "PLACEHOLDER_COUNT week ago", "PLACEHOLDER_COUNT weeks ago"),
+    (365 * _DAY, 30 * _DAY, "month_singular", "months_plural", "PLACEHOLDER_COUNT month ago", "PLACEHOLDER_COUNT months ago"),
+    (None, 365 * _DAY, "year_singular", "years_plural", "PLACEHOLDER_COUNT year ago", "PLACEHOLDER_COUNT years ago"),
+)
 
-    return sorted_games[:limit]
+
+def _get_time_format(language: str) -> Tuple[Dict, Dict]:
+    """
+    Returns the TIME_FORMAT and MESSAGES sections of the player_stats locale template.
+
+    :param language: Language code
+    :return: Tuple of (time_format, messages)
+    """
+    template = load_embed_template("player_stats", language)
+    return template.get("TIME_FORMAT", {}), template.get("MESSAGES", {})
 
 
-def format_time_since(iso_timestamp: str, language: str = None) -> str:
+def format_time_since(iso_timestamp: str, language: str = None, now: datetime = None) -> str:
     """
     Format ISO timestamp to human-readable "X days ago" with locale support.
 
     :param iso_timestamp: ISO format timestamp string
     :param language: Language code (en/de), defaults to CONFIG.bot.language
+    :param now: Reference time (timezone-aware), pass it in when formatting several timestamps
     :return: Human-readable string
     """
     if not language:
         language = CONFIG.bot.language
-
-    # Load locale templates
-    template = load_embed_template("player_stats", language)
-    time_format = template.get("TIME_FORMAT", {})
-    messages = template.get("MESSAGES", {})
-
     if not iso_timestamp:
-        return messages.get("never", "Never")
+        return _render_time_since(language, "never", 0)
+
+    if now is None:
+        now = now_in_bot_timezone()
 
     try:
-        past = datetime.fromisoformat(iso_timestamp)
-        from zoneinfo import ZoneInfo
-        now = datetime.now(tz=ZoneInfo(CONFIG.bot.timezone))
-        delta = now - past
-
-        if delta.days == 0:
-            if delta.seconds < 3600:
-                return time_format.get("less_than_hour", "Less than an hour ago")
-            hours = delta.seconds // 3600
-            if hours == 1:
-                template_str = time_format.get("hour_singular", "PLACEHOLDER_COUNT hour ago")
-            else:
-                template_str = time_format.get("hours_plural", "PLACEHOLDER_COUNT hours ago")
-            return template_str.replace("PLACEHOLDER_COUNT", str(hours))
-        elif delta.days == 1:
-            return time_format.get("yesterday", "Yesterday")
-        elif delta.days < 7:
-            if delta.days == 1:
-                template_str = time_format.get("day_singular", "PLACEHOLDER_COUNT day ago")
-            else:
-                template_str = time_format.get("days_plural", "PLACEHOLDER_COUNT days ago")
-            return template_str.replace("PLACEHOLDER_COUNT", str(delta.days))
-        elif delta.days < 30:
-            weeks = delta.days // 7
-            if weeks == 1:
-                template_str = time_format.get("week_singular", "PLACEHOLDER_COUNT week ago")
-            else:
-                template_str = time_format.get("weeks_plural", "PLACEHOLDER_COUNT weeks ago")
-            return template_str.replace("PLACEHOLDER_COUNT", str(weeks))
-        elif delta.days < 365:
-            months = delta.days // 30
-            if months == 1:
-                template_str = time_format.get("month_singular", "PLACEHOLDER_COUNT month ago")
-            else:
-                template_str = time_format.get("months_plural", "PLACEHOLDER_COUNT months ago")
-            return template_str.replace("PLACEHOLDER_COUNT", str(months))
-        else:
-            years = delta.days // 365
-            if years == 1:
-                template_str = time_format.get("year_singular", "PLACEHOLDER_COUNT year ago")
-            else:
-                template_str = time_format.get("years_plural", "PLACEHOLDER_COUNT years ago")
-            return template_str.replace("PLACEHOLDER_COUNT", str(years))
+        total_seconds = (now - datetime.fromisoformat(iso_timestamp)).total_seconds()
     except (ValueError, AttributeError):
+        return _render_time_since(language, "unknown", 0)
+
+    # The bucket is picked from the exact delta, only the rendering of (bucket, count) is cached
+    for index, (limit, unit, *_) in enumerate(_TIME_SINCE_BUCKETS):
+        if limit is None or total_seconds < limit:
+            break
+
+    count = int(total_seconds // unit) if unit else 0
+    return _render_time_since(language, index, count)
+
+
+@lru_cache(maxsize=512)
+def _render_time_since(language: str, bucket, count: int) -> str:
+    """
+    Renders a format_time_since result from the locale template, cached per (language, bucket, count).
+
+    :param language: Language code
+    :param bucket: Index into _TIME_SINCE_BUCKETS, or "never" / "unknown"
+    :param count: Number of units for buckets with a unit
+    """
+    time_format, messages = _get_time_format(language)
+
+    if bucket == "never":
+        return messages.get("never", "Never")
+    if bucket == "unknown":
         return messages.get("unknown", "Unknown")
+
+    _, unit, singular_key, plural_key, singular_default, plural_default = _TIME_SINCE_BUCKETS[bucket]
+    if unit is None:
+        return time_format.get(singular_key, singular_default)
+
+    if count == 1:
+        template_str = time_format.get(singular_key, singular_default)
+    else:
+        template_str = time_format.get(plural_key, plural_default)
+    return template_str.replace("PLACEHOLDER_COUNT", str(count))
@@ -1,11 +1,20 @@
 # modules/task_manager.py
 
 import asyncio
+from dataclasses import dataclass
 
 # Local modules
 from modules.logger import logger
 
-all_tasks = {}  # name -> {"task": task, "coro": coro_name}
+
+@dataclass(slots=True)
+class TaskEntry:
+    """A managed task and the name of its coroutine (resolved once when the task is added)."""
+    task: asyncio.Task
+    coro_name: str
+
+
+all_tasks = {}  # name -> TaskEntry
 
 
 def add_task(name, task):
@@ -13,17 +22,26 @@ def add_task(name, task):
     Adds a task to the task manager.
     If a task with the same name exists and is not done, it will be cancelled.
     """
-    if name in all_tasks and not all_tasks[name]["task"].done():
+    if name in all_tasks and not all_tasks[name].task.done():
         logger.info(f"[TASK-MANAGER] Task '{name}' is being overwritten and old task cancelled.")
-        all_tasks[name]["task"].cancel()
-    all_tasks[name] = {"task": task, "coro": str(task.get_coro().__name__) if hasattr(task, "get_coro") else "unknown"}
+        all_tasks[name].task.cancel()
+    coro_name = str(task.get_coro().__name__) if hasattr(task, "get_coro") else "unknown"
+    all_tasks[name] = TaskEntry(task, coro_name)
+    task.add_done_callback(lambda finished: _remove_finished_task(name, finished))
     logger.info(f"[TASK-MANAGER] Task '{name}' started.")
 
 
+def _remove_finished_task(name, task):
+    """Drops a finished task from the registry, unless the name was already reused for a new task."""
+    entry = all_tasks.get(name)
+    if entry is not None and entry.task is task:
+        del all_tasks[name]
+
+
 def cancel_all_tasks():
     """Cancels all active tasks."""
     for name, entry in list(all_tasks.items()):
-        task = entry["task"]
+        task = entry.task
         if not task.done():
             try:
                 logger.info(f"[TASK-MANAGER] Cancelling task: {name}")
@@ -34,22 +52,22 @@ def cancel_all_tasks():
 
 
 def get_all_tasks():
-    """Returns a dict of all tasks."""
+    """Returns a dict of all tasks (name -> TaskEntry)."""
     return all_tasks
 
 
 def log_active_tasks():
     """Logs information about all active tasks."""
     for name, entry in all_tasks.items():
-        task = entry["task"]
-        coro = entry["coro"]
-        logger.info(f"[TASK-MANAGER] Task: {name}, done={task.done()}, cancelled={task.cancelled()}, coroutine={coro}")
+        task = entry.task
+        logger.info(f"[TASK-MANAGER] Task: {name}, done={task.done()}, cancelled={task.cancelled()}, coroutine={entry.coro_name}")
 
 
 def cancel_tournament_tasks():
     """
     Cancels all tournament-related tasks.
-    Used when tournament is manually ended or aborted.
+    Used when tournament is manually ended or aborted, and at the end of every tournament.
+    The calling task is never cancelled, so a timer that ends the tournament can call this.
     """
     tournament_task_prefixes = [
         "tournament_end",
@@ -58,9 +76,16 @@ def cancel_tournament_tasks():
         "reschedule_timer"
     ]
 
+    try:
+        current = asyncio.current_task()
+    except RuntimeError:  # called outside the event loop
+        current = None
+
     cancelled_tasks = []
     for name, entry in list(all_tasks.items()):
-        task = entry["task"]
+        task = entry.task
+        if task is current:
+            continue
 
         # Check if task name starts with any tournament-related prefix
         if any(name.startswith(prefix) for prefix in tournament_task_prefixes):
@@ -1,36 +1,32 @@
 # modules/tournament.py
 
 import asyncio
-import re
-from datetime import datetime, timedelta
 from typing import Optional
-from zoneinfo import ZoneInfo
 
 import discord
-from discord import Embed, Interaction, app_commands
+from discord import Interaction
 
 # Local modules
 from modules import poll
 from modules.archive import archive_current_tournament, update_tournament_history
+from modules.availability_conflict_resolver import ConflictResolutionCoordinator
 from modules.config import CONFIG
 from modules.dataStorage import (
     delete_tournament_file,
-    load_games,
     load_global_data,
     load_tournament_data,
     reset_tournament,
+    save_global_data,
     save_tournament_data,
 )
 from modules.embeds import (
-    build_embed_from_template,
     load_embed_template,
-    send_list_matches,
     send_match_schedule_for_channel,
     send_registration_closed,
-    send_tournament_announcement,
     send_tournament_end_announcement,
     get_message,
 )
+from modules.key_manager import notify_winners_about_keys
 from modules.logger import logger
 from modules.matchmaker import (
     auto_match_solo,
@@ -45,34 +41,108 @@ from modules.info import (
     get_winner_team,
 )
 from modules.stats_tracker import (
-    record_match_result,
+    player_stats_batch,
+    record_match_results_bulk,
     update_tournament_participation,
     update_tournament_wins
 )
-from modules.task_manager import add_task
+from modules.task_manager import add_task, cancel_tournament_tasks
 from modules.utils import (
     all_matches_completed,
-    autocomplete_teams,
     calculate_optimal_tournament_duration,
     extract_user_id,
     get_current_chosen_game,
-    get_player_team,
-    has_permission,
-    smart_send,
     now_in_bot_timezone,
-    ensure_timezone_aware,
     parse_iso_datetime,
-    get_bot_timezone
 )
 
-# Global variables for double-call prevention
-_registration_closed = False
+# Double-call prevention: the task running close_registration_after_delay for the current tournament
+_registration_close_task: Optional[asyncio.Task] = None
 _registration_lock = asyncio.Lock()  # Prevent race conditions
 
+# Double-call prevention for the tournament end: the task running _run_tournament_end
+_tournament_end_task: Optional[asyncio.Task] = None
+_tournament_end_lock = asyncio.Lock()
+
+# (members, member IDs) for teams missing from the tournament data
+_NO_MEMBERS = ((), ())
+
 
 # ---------------------------------------
 # Helper Functions
 # ---------------------------------------
+def _update_player_stats(matches, team_members, chosen_game: str, winner_ids):
+    """
+    Records match results, participation and wins of a finished tournament.
+    Blocking file I/O, run via asyncio.to_thread from the tournament end.
+
+    :param matches: Match list of the tournament.
+    :param team_members: Team name -> (member mentions, member IDs).
+    :param chosen_game: The tournament's game.
+    :param winner_ids: IDs of the winning team.
+    """
+    # Match results, participation and wins touch mostly the same players,
+    # the batch writes each of their files once at the end
+    with player_stats_batch():
+        # Process all completed matches for detailed stats
+        try:
+            completed_count = 0
+
+            match_results = []
+            # Without a known game no match stats are recorded, skip the loop entirely
+            recordable = matches if chosen_game != "Unknown" else []
+            for match in (m for m in recordable if m.get("status") == "completed"):
+                completed_count += 1
+                winner_team = match.get("winner")
+                team1 = match.get("team1")
+                team2 = match.get("team2")
+
+                if not winner_team or not team1 or not team2:
+                    continue
+
+                loser_team = team2 if winner_team == team1 else team1
+
+                # Skip matches where either side has no resolvable players before building anything
+                winner_members, winner_ids_match = team_members.get(winner_team, _NO_MEMBERS)
+                loser_members, loser_ids_match = team_members.get(loser_team, _NO_MEMBERS)
+                if not winner_ids_match or not loser_ids_match:
+                    continue
+
+                match_results.append({
+                    "winner_ids": winner_ids_match,
+                    "loser_ids": loser_ids_match,
+                    "winner_mentions": winner_members,
+                    "loser_mentions": loser_members,
+                })
+
+            # Each player file is written once instead of once per match
+            if match_results:
+                record_match_results_bulk(match_results, chosen_game)
+
+            logger.info(f"[STATS] Match history stats updated for {completed_count} completed matches")
+        except Exception as e:
+            logger.error(f"[STATS] Error processing match stats: {e}", exc_info=True)
+
+        # Update tournament participation for all players
+        try:
+            # A player listed in several teams (admin edits) still counts as one participation
+            all_participant_ids = list(dict.fromkeys(
+                user_id for _, member_ids in team_members.values() for user_id in member_ids
+            ))
+
+            if all_participant_ids and chosen_game != "Unknown":
+                update_tournament_participation(all_participant_ids, chosen_game)
+                logger.info(f"[STATS] Tournament participation updated for {len(all_participant_ids)} players")
+        except Exception as e:
+            logger.error(f"[STATS] Error updating tournament participation: {e}", exc_info=True)
+
+        if winner_ids:
+            update_tournament_wins(winner_ids)
+            logger.info(f"[TOURNAMENT] Winners saved: {winner_ids} for game: {chosen_game}")
+        else:
+            logger.warning("[TOURNAMENT] No winners found.")
+
+
 async def end_tournament_procedure(
     channel: discord.TextChannel,
     manual_trigger: bool = False,
@@ -85,24 +155,51 @@ async def end_tournament_procedure(
     - Updates statistics
     - Resets tournament state
     - Announces results
+
+    Runs at most once at a time: a second call while an end is in progress waits for
+    that one instead of recording the stats again. Cancelling the caller (e.g. the end
+    timer via cancel_tournament_tasks) does not stop an end that already started.
     """
-    tournament = load_tournament_data()
+    global _tournament_end_task
 
-    if not manual_trigger and not all_matches_completed():
+    async with _tournament_end_lock:
+        if _tournament_end_task is None or _tournament_end_task.done():
+            _tournament_end_task = asyncio.create_task(
+                _run_tournament_end(channel, manual_trigger, interaction, bot)
+            )
+        else:
+            logger.warning("[TOURNAMENT] Tournament end already in progress – waiting for it instead of ending twice.")
+        end_task = _tournament_end_task
+
+    await asyncio.shield(end_task)
+
+
+async def _run_tournament_end(
+    channel: discord.TextChannel,
+    manual_trigger: bool,
+    interaction: Optional[Interaction],
+    bot: Optional[discord.Client],
+):
+    """The actual end procedure, see end_tournament_procedure (runs as its own task)."""
+    # Read-only snapshot, parsed once and handed to the helpers below (winner IDs, chosen game, winner team).
+    # It stays valid after the tournament file is reset further down
+    tournament = load_tournament_data(readonly=True)
+
+    if not manual_trigger and not all_matches_completed(tournament):
         logger.info("[TOURNAMENT] Not all matches completed. Aborting automatic end.")
         await channel.send(get_message("ERRORS", "matches_incomplete"))
         return
 
-    # Archive tournament data
+    # Archive tournament data (file I/O, off the event loop like the other blocking steps below)
     try:
-        archive_path = archive_current_tournament()
+        archive_path = await asyncio.to_thread(archive_current_tournament)
         logger.info(f"[TOURNAMENT] Tournament successfully archived to: {archive_path}")
     except Exception as e:
         logger.error(f"[TOURNAMENT] Error archiving tournament: {e}")
 
     # Winners, MVP, etc.
-    winner_ids = get_winner_ids()
-    chosen_game = get_current_chosen_game()
+    winner_ids = get_winner_ids(tournament)
+    chosen_game = get_current_chosen_game(tournament)
     mvp = get_mvp()  # mvp as str e.g. <@1234567890>
 
     # Extract MVP ID if present
@@ -110,90 +207,41 @@ async def end_tournament_procedure(
     if mvp:
         new_champion_id = extract_user_id(mvp)
 
-    # Process all completed matches for detailed stats
-    try:
-        matches = tournament.get("matches", [])
-        teams = tournament.get("teams", {})
-        completed_matches = [m for m in matches if m.get("status") == "completed"]
-
-        logger.info(f"[STATS] Processing {len(completed_matches)} completed matches for stats tracking")
-
-        for match in completed_matches:
-            winner_team = match.get("winner")
-            team1 = match.get("team1")
-            team2 = match.get("team2")
-
-            if not winner_team or not team1 or not team2:
-                continue
-
-            loser_team = team2 if winner_team == team1 else team1
-
-            winner_team_data = teams.get(winner_team, {})
-            loser_team_data = teams.get(loser_team, {})
-
-            winner_members = winner_team_data.get("members", [])
-            loser_members = loser_team_data.get("members", [])
-
-            # Extract user IDs using extract_user_id helper
-            winner_ids_match = []
-            for m in winner_members:
-                user_id = extract_user_id(m)
-                if user_id:
-                    winner_ids_match.append(str(user_id))
-
-            loser_ids_match = []
-            for m in loser_members:
-                user_id = extract_user_id(m)
-                if user_id:
-                    loser_ids_match.append(str(user_id))
-
-            if winner_ids_match and loser_ids_match and chosen_game != "Unknown":
-                record_match_result(
-                    winner_ids=winner_ids_match,
-                    loser_ids=loser_ids_match,
-                    game=chosen_game,
-                    winner_mentions=winner_members,
-                    loser_mentions=loser_members
-                )
-
-        logger.info(f"[STATS] Match history stats updated for {len(completed_matches)} matches")
-    except Exception as e:
-        logger.error(f"[STATS] Error processing match stats: {e}", exc_info=True)
-
-    # Update tournament participation for all players
-    try:
-        all_participant_ids = []
-        for team_data in tournament.get("teams", {}).values():
-            members = team_data.get("members", [])
-            for member in members:
-                user_id = extract_user_id(member)
-                if user_id:
-                    all_participant_ids.append(str(user_id))
-
-        if all_participant_ids and chosen_game != "Unknown":
-            update_tournament_participation(all_participant_ids, chosen_game)
-            logger.info(f"[STATS] Tournament participation updated for {len(all_participant_ids)} players")
-    except Exception as e:
-        logger.error(f"[STATS] Error updating tournament participation: {e}", exc_info=True)
-
-    if winner_ids:
-        update_tournament_wins(winner_ids)
-        logger.info(f"[TOURNAMENT] Winners saved: {winner_ids} for game: {chosen_game}")
+    # Resolve every team's members and member IDs once, shared by the match and participation stats below:
+    # team name -> (member mentions, member IDs)
+    # Without a known game neither is recorded, so no member is parsed at all
+    team_members = {}
+    if chosen_game != "Unknown":
+        for team_name, team_data in tournament.get("teams", {}).items():
+            members = team_data.get("members") or []
+            team_members[team_name] = (members, [str(user_id) for user_id in map(extract_user_id, members) if user_id])
     else:
-        logger.warning("[TOURNAMENT] No winners found.")
+        logger.warning("[STATS] Skipped match/participation stats (unknown game)")
 
-    update_tournament_history(
+    # Blocking stats I/O runs off the event loop. The three updates stay sequential in one thread:
+    # they share player files and the write-back cache, so running them in parallel would only contend for the lock
+    await asyncio.to_thread(_update_player_stats, tournament.get("matches", []), team_members, chosen_game, winner_ids)
+
+    await asyncio.to_thread(
+        update_tournament_history,
         winner_ids=winner_ids,
         chosen_game=chosen_game or "Unknown",
         mvp_name=mvp or "No MVP",
     )
 
+    # Update game statistics and last tournament winner with a single load/save of global data
+    global_data = load_global_data()
+    global_data_changed = False
+
+    if chosen_game and chosen_game != "Unknown":
+        game_stats = global_data.setdefault("game_stats", {})
+        game_stats[chosen_game] = game_stats.get(chosen_game, 0) + 1
+        global_data_changed = True
+        logger.info(f"[STATS] Game statistics updated: {chosen_game} has now been played {game_stats[chosen_game]}x.")
+
     # Save last tournament winner for key claiming system
     if winner_ids:
-        from modules.dataStorage import load_global_data, save_global_data
-
-        global_data = load_global_data()
-        winning_team_name = get_winner_team(winner_ids) or "Unknown Team"
+        winning_team_name = get_winner_team(winner_ids, tournament) or "Unknown Team"
 
         global_data["last_tournament_winner"] = {
             "winning_team": winning_team_name,
@@ -201,44 +249,67 @@ async def end_tournament_procedure(
             "ended_at": now_in_bot_timezone().isoformat(),
             "winner_ids": [str(uid) for uid in winner_ids],  # Store as strings for key claiming
         }
-        save_global_data(global_data)
+        global_data_changed = True
         logger.info(f"[TOURNAMENT] Last winner saved: {winning_team_name} with {len(winner_ids)} members")
 
-    reset_tournament()
+    if global_data_changed:
+        save_global_data(global_data)
+
+    # Timers of the finished tournament (e.g. pending reschedules) must not fire on the next one
+    cancel_tournament_tasks()
 
+    # Deleting the file is the reset: load_tournament_data returns the defaults while it is missing.
+    # Only if it can't be deleted the defaults are written over it
     try:
-        delete_tournament_file()
-        logger.info("[TOURNAMENT] Tournament file deleted.")
+        if await asyncio.to_thread(delete_tournament_file):
+            logger.info("[TOURNAMENT] Tournament file deleted.")
+        else:
+            await asyncio.to_thread(reset_tournament)
     except Exception as e:
-        logger.error(f"[TOURNAMENT] Error deleting tournament file: {e}")
+        logger.error(f"[TOURNAMENT] Error resetting tournament file: {e}")
 
     # Send final embed (before reset, so chosen_game is available)
     mvp_message = f"🏆 Tournament MVP: **{mvp}**!" if mvp else "🏆 No MVP determined."
-    await send_tournament_end_announcement(channel, mvp_message, winner_ids, chosen_game, new_champion_id)
+    end_tasks = [send_tournament_end_announcement(channel, mvp_message, winner_ids, chosen_game, new_champion_id)]
 
     # Notify winners about available game keys
     if bot and winner_ids:
-        try:
-            winning_team_name = get_winner_team(winner_ids)
-            if winning_team_name:
-                from modules.key_manager import notify_winners_about_keys
-                await notify_winners_about_keys(bot, winner_ids, winning_team_name)
-        except Exception as e:
-            logger.error(f"[TOURNAMENT] Error notifying winners about keys: {e}")
+        async def notify_winners():
+            try:
+                # The tournament file is already reset here, use the snapshot loaded at the start
+                winning_team_name = get_winner_team(winner_ids, tournament)
+                if winning_team_name:
+                    await notify_winners_about_keys(bot, winner_ids, winning_team_name)
+            except Exception as e:
+                logger.error(f"[TOURNAMENT] Error notifying winners about keys: {e}")
+
+        end_tasks.append(notify_winners())
 
     if mvp and new_champion_id:  # If MVP exists and ID was successfully extracted
-        try:
-            guild = channel.guild  # Get guild from channel
-            await update_champion_role(guild, new_champion_id)
-        except Exception as e:
-            logger.error(f"[CHAMPION] Error updating champion role: {e}")
+        async def update_champion():
+            try:
+                guild = channel.guild  # Get guild from channel
+                await update_champion_role(guild, new_champion_id)
+            except Exception as e:
+                logger.error(f"[CHAMPION] Error updating champion role: {e}")
+
+        end_tasks.append(update_champion())
+
+    # Announcement, key DMs and role update don't depend on each other, send them concurrently
+    results = await asyncio.gather(*end_tasks, return_exceptions=True)
+    if isinstance(results[0], Exception):
+        logger.error(f"[TOURNAMENT] Error sending tournament end announcement: {results[0]}")
 
     logger.info("[TOURNAMENT] Tournament completed and system ready for new one.")
 
 
 async def auto_end_poll(bot: discord.Client, channel: discord.TextChannel, delay_seconds: int):
-    """Automatically ends poll after delay."""
-    await asyncio.sleep(delay_seconds)
+    """Automatically ends poll after delay. Register it via add_task("auto_end_poll", ...)."""
+    try:
+        await asyncio.sleep(delay_seconds)
+    except asyncio.CancelledError:
+        logger.info("[POLL] Scheduled poll end was cancelled.")
+        raise
     await poll.end_poll(bot, channel)
 
 
@@ -254,6 +325,10 @@ async def update_champion_role(guild: discord.Guild, new_champion_id: int, role_
         logger.error(f"[CHAMPION] Role '{role_name}' not found!")
         return
 
+    # Both lookups below read the member cache, fill it in one gateway request if startup chunking hasn't
+    if not guild.chunked:
+        await guild.chunk(cache=True)
+
     # Assign new champion
     new_champion = guild.get_member(new_champion_id)
     if not new_champion:
@@ -267,21 +342,24 @@ async def update_champion_role(guild: discord.Guild, new_champion_id: int, role_
         )
         return
 
-    # Find old champion and remove role
-    for member in guild.members:
-        if champion_role in member.roles:
-            try:
-                await member.remove_roles(champion_role, reason="New champion was assigned.")
-                logger.info(f"[CHAMPION] Champion role removed from {member.display_name}")
-            except Exception as e:
-                logger.error(f"[CHAMPION] Error removing champion role from {member.display_name}: {e}")
+    # Old champions (role.members instead of scanning the whole guild) lose the role
+    async def remove_from(member: discord.Member):
+        try:
+            await member.remove_roles(champion_role, reason="New champion was assigned.")
+            logger.info(f"[CHAMPION] Champion role removed from {member.display_name}")
+        except Exception as e:
+            logger.error(f"[CHAMPION] Error removing champion role from {member.display_name}: {e}")
 
-    # Give role to new champion
-    try:
-        await new_champion.add_roles(champion_role, reason="Tournament victory MVP.")
-        logger.info(f"[CHAMPION] Champion role granted to {new_champion.display_name}")
-    except Exception as e:
-        logger.error(f"[CHAMPION] Error granting champion role to {new_champion.display_name}: {e}")
+    # New champion gets the role
+    async def grant():
+        try:
+            await new_champion.add_roles(champion_role, reason="Tournament victory MVP.")
+            logger.info(f"[CHAMPION] Champion role granted to {new_champion.display_name}")
+        except Exception as e:
+            logger.error(f"[CHAMPION] Error granting champion role to {new_champion.display_name}: {e}")
+
+    # Independent role updates, sent to Discord concurrently
+    await asyncio.gather(*(remove_from(member) for member in champion_role.members), grant())
 
 
 # ---------------------------------------
@@ -310,15 +388,16 @@ async def execute_registration_close_procedure(channel: discord.TextChannel):
         logger.info("[TOURNAMENT] Registration closed.")
 
     try:
-        # Step 1: Clean up orphaned teams (modifies tournament data)
-        await cleanup_orphan_teams(channel)
+        # Steps 1-5 work on the loaded data in memory, it is saved once after step 5
 
-        # Step 2: Automatically match solo players (modifies tournament data)
-        auto_match_solo()
+        # Step 1: Clean up orphaned teams
+        await cleanup_orphan_teams(channel, tournament)
 
-        # Step 3: Reload after modifications, create schedule
-        tournament = load_tournament_data()
-        create_round_robin_schedule(tournament)
+        # Step 2: Automatically match solo players
+        auto_match_solo(tournament)
+
+        # Step 3: Create schedule
+        create_round_robin_schedule(tournament, save=False)
 
         # Step 4: Auto-calculate optimal tournament duration
         num_teams = len(tournament.get("teams", {}))
@@ -330,7 +409,6 @@ async def execute_registration_close_procedure(channel: discord.TextChannel):
                 # Calculate and update tournament end
                 optimal_end = calculate_optimal_tournament_duration(num_teams, registration_end)
                 tournament["tournament_end"] = optimal_end.isoformat()
-                save_tournament_data(tournament)
                 logger.info(f"[TOURNAMENT] Duration auto-set to {optimal_end.strftime('%Y-%m-%d')}")
 
                 # Schedule automatic tournament end
@@ -348,11 +426,9 @@ async def execute_registration_close_procedure(channel: discord.TextChannel):
         save_tournament_data(tournament)
 
         # Step 6: Generate slots and assign matches
-        await generate_and_assign_slots()
+        await generate_and_assign_slots(tournament)
 
         # Step 7: Check for availability conflicts and resolve them
-        from modules.availability_conflict_resolver import ConflictResolutionCoordinator
-
         resolver = ConflictResolutionCoordinator(channel)
         has_conflicts = await resolver.detect_and_resolve_conflicts()
 
@@ -365,7 +441,6 @@ async def execute_registration_close_procedure(channel: discord.TextChannel):
             )
 
             # Load locale message
-            from modules.embeds import load_embed_template
             template = load_embed_template("availability_conflict", CONFIG.bot.language)
             messages = template.get("MESSAGES", {})
             msg = messages.get(
@@ -376,7 +451,9 @@ async def execute_registration_close_procedure(channel: discord.TextChannel):
             await channel.send(msg)
         else:
             # No conflicts - publish schedule immediately
-            tournament = load_tournament_data()
+            # Slot assignment and conflict detection rewrote the file since the save above, so the local dict is stale;
+            # the overview only reads the matches, the shared read-only parse is enough
+            tournament = load_tournament_data(readonly=True)
             matches = tournament.get("matches", [])
 
             description_text = generate_schedule_overview(matches)
@@ -390,35 +467,56 @@ async def execute_registration_close_procedure(channel: discord.TextChannel):
         raise
 
 
+def reset_registration_close() -> None:
+    """Allows close_registration_after_delay to run again, called when a new tournament starts."""
+    global _registration_close_task
+    _registration_close_task = None
+
+
 async def close_registration_after_delay(delay_seconds: int, channel: discord.TextChannel):
     """
     Closes registration after a delay automatically
     and starts automatic matchmaking & cleanup.
 
-    Thread-safe implementation using lock to prevent double execution.
+    Only one close per tournament: while a close task is pending or has finished,
+    further calls return right away. A cancelled close (e.g. tournament aborted, or
+    replaced via add_task) can be scheduled again, even before its cancel took effect.
     """
-    global _registration_closed, _registration_lock
+    global _registration_close_task
 
-    # CRITICAL: Acquire lock BEFORE sleeping to prevent race conditions
+    # CRITICAL: Claim the close BEFORE sleeping to prevent race conditions
     async with _registration_lock:
-        if _registration_closed:
-            logger.warning("[REGISTRATION] Process already completed – double prevention active.")
+        previous = _registration_close_task
+        # cancelling(): add_task cancels the old task right before this one starts,
+        # the old task only becomes cancelled() once it runs again
+        if previous is not None and not previous.cancelled() and not previous.cancelling():
+            logger.warning("[REGISTRATION] Process already scheduled or completed – double prevention active.")
             return
 
-        # Mark as in-progress immediately (still holding lock)
-        _registration_closed = True
+        _registration_close_task = asyncio.current_task()
         logger.info(f"[REGISTRATION] Will auto-close in {delay_seconds} seconds")
 
     # Now we can safely sleep - we've marked ourselves as in-progress
-    await asyncio.sleep(delay_seconds)
+    try:
+        await asyncio.sleep(delay_seconds)
+    except asyncio.CancelledError:
+        # Release the claim, unless a replacement task already took it over
+        if _registration_close_task is asyncio.current_task():
+            _registration_close_task = None
+        logger.info("[REGISTRATION] Scheduled registration close was cancelled.")
+        raise
 
     # Execute the shared close procedure
     await execute_registration_close_procedure(channel)
 
 
 async def close_tournament_after_delay(delay_seconds: int, channel: discord.TextChannel):
-    """Closes tournament after delay."""
-    await asyncio.sleep(delay_seconds)
+    """Closes tournament after delay. Register it via add_task("tournament_end_timer", ...)."""
+    try:
+        await asyncio.sleep(delay_seconds)
+    except asyncio.CancelledError:
+        logger.info("[TOURNAMENT] Scheduled tournament end was cancelled.")
+        raise
 
     await end_tournament_procedure(channel)
 
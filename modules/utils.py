@@ -3,6 +3,7 @@
 import random
 import re
 from datetime import datetime, time, timedelta
+from functools import lru_cache
 from typing import List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
@@ -21,6 +22,9 @@ from modules.dataStorage import (
 # Local modules
 from modules.logger import logger
 
+# Precompiled pattern for pulling user IDs out of mentions (used by extract_user_id only)
+_USER_ID_RE = re.compile(r"(\d{15,20})")
+
 
 def extract_user_id(mention: str) -> Optional[int]:
     """
@@ -34,9 +38,13 @@ def extract_user_id(mention: str) -> Optional[int]:
     if not mention:
         return None
 
-    # Try regex extraction first (most robust)
-    import re
-    match = re.search(r'(\d{15,20})', mention)
+    # Well-formed mentions are just the ID wrapped in <@ / <@! and >, no regex needed
+    candidate = mention.strip("<@!> ")
+    if candidate.isascii() and candidate.isdigit() and 15 <= len(candidate) <= 20:
+        return int(candidate)
+
+    # Fall back to regex extraction (most robust)
+    match = _USER_ID_RE.search(mention)
     if match:
         try:
             return int(match.group(1))
@@ -82,6 +90,8 @@ def has_permission(member: discord.Member, *required_permissions: str) -> bool:
     """
     Checks if the member has at least one of the roles specified in the configuration
     under the given permissions OR is listed as a user ID in the permission list.
+
+    Command handlers call this before loading any data, so rejected users cause no file I/O.
     """
     allowed_roles = []
     allowed_ids = set()
@@ -184,8 +194,8 @@ def get_tournament_status() -> str:
 
     :return: String describing the current tournament status.
     """
-    tournament = load_tournament_data()
-    global_data = load_global_data()
+    tournament = load_tournament_data(readonly=True)
+    global_data = load_global_data(readonly=True)
 
     running = tournament.get("running", False)
     registration_open = tournament.get("registration_open", False)
@@ -193,9 +203,9 @@ def get_tournament_status() -> str:
     # Determine chosen game based on poll_results
     poll_results = tournament.get("poll_results", {})
     if poll_results:
-        sorted_games = sorted(poll_results.items(), key=lambda kv: kv[1], reverse=True)
-        if sorted_games and sorted_games[0][1] > 0:
-            chosen_game = sorted_games[0][0]
+        top_game = max(poll_results.items(), key=lambda kv: kv[1])
+        if top_game[1] > 0:
+            chosen_game = top_game[0]
         else:
             chosen_game = "No votes cast"
     else:
@@ -231,17 +241,15 @@ def get_all_registered_user_ids(tournament: dict) -> list[int]:
     ids = []
 
     for solo_entry in tournament.get("solo", []):
-        mention = solo_entry.get("player")
-        if mention:
-            match = re.search(r"\d+", mention)
-            if match:
-                ids.append(int(match.group(0)))
+        user_id = extract_user_id(solo_entry.get("player"))
+        if user_id:
+            ids.append(user_id)
 
     for team_entry in tournament.get("teams", {}).values():
         for member in team_entry.get("members", []):
-            match = re.search(r"\d+", member)
-            if match:
-                ids.append(int(match.group(0)))
+            user_id = extract_user_id(member)
+            if user_id:
+                ids.append(user_id)
 
     return ids
 
@@ -584,7 +592,7 @@ def get_player_team(user_mention_or_id: str) -> Optional[str]:
     :param user_mention_or_id: String (mention e.g. "<@123456789>" or ID "123456789")
     :return: Team name or None
     """
-    tournament = load_tournament_data()
+    tournament = load_tournament_data(readonly=True)
 
     for team_name, team_data in tournament.get("teams", {}).items():
         for member in team_data.get("members", []):
@@ -639,7 +647,7 @@ async def autocomplete_teams(interaction: Interaction, current: str):
     """Autocomplete function for team selection."""
     logger.info(f"[AUTOCOMPLETE] Called – Input: {current}")
 
-    tournament = load_tournament_data()
+    tournament = load_tournament_data(readonly=True)
     if not tournament:
         logger.error("[AUTOCOMPLETE] No tournament data loaded!")
         return []
@@ -671,22 +679,28 @@ async def games_autocomplete(interaction: discord.Interaction, current: str):
     ][:25]  # Discord API max 25
 
 
-def all_matches_completed() -> bool:
+def all_matches_completed(tournament: dict = None) -> bool:
     """
     Check if all matches are completed or forfeited.
     Forfeit matches count as completed since they have a determined outcome.
+
+    :param tournament: Tournament data snapshot to use, loaded read-only if omitted
     """
-    tournament = load_tournament_data()
+    if tournament is None:
+        tournament = load_tournament_data(readonly=True)
     matches = tournament.get("matches", [])
 
     return all(match.get("status") in ("completed", "forfeit") for match in matches)
 
 
-def get_current_chosen_game() -> str:
+def get_current_chosen_game(tournament: dict = None) -> str:
     """
     Gets the currently chosen game from the tournament file.
+
+    :param tournament: Tournament data snapshot to use, loaded read-only if omitted
     """
-    tournament = load_tournament_data()
+    if tournament is None:
+        tournament = load_tournament_data(readonly=True)
     poll_results = tournament.get("poll_results") or {}
 
     chosen_game = poll_results.get("chosen_game", "Unknown")
@@ -705,10 +719,10 @@ async def update_all_participants() -> None:
     # Teams
     for team_entry in tournament.get("teams", {}).values():
         for member in team_entry.get("members", []):
-            match = re.search(r"\d+", member)
-            if not match:
+            user_id = extract_user_id(member)
+            if not user_id:
                 continue
-            user_id = match.group(0)
+            user_id = str(user_id)
             stats = player_stats.get(user_id)
             if stats is None:
                 stats = {
@@ -723,11 +737,10 @@ async def update_all_participants() -> None:
 
     # Solo players
     for solo_entry in tournament.get("solo", []):
-        player_str = solo_entry.get("player", "")
-        match = re.search(r"\d+", player_str)
-        if not match:
+        user_id = extract_user_id(solo_entry.get("player", ""))
+        if not user_id:
             continue
-        user_id = match.group(0)
+        user_id = str(user_id)
         stats = player_stats.get(user_id)
         if stats is None:
             stats = {
@@ -790,13 +803,20 @@ def get_default_availability() -> dict:
 # TIMEZONE HELPER FUNCTIONS
 # =======================================
 
+@lru_cache(maxsize=8)
+def _get_zoneinfo(key: str) -> ZoneInfo:
+    """Returns the ZoneInfo for an IANA key, built once per key."""
+    return ZoneInfo(key)
+
+
 def get_bot_timezone() -> ZoneInfo:
     """
     Returns the configured bot timezone as a ZoneInfo object.
+    Keyed on the configured name, so a timezone changed via setup is picked up.
 
     :return: ZoneInfo object for the bot's timezone
     """
-    return ZoneInfo(CONFIG.bot.timezone)
+    return _get_zoneinfo(CONFIG.bot.timezone)
 
 
 def now_in_bot_timezone() -> datetime:
@@ -823,16 +843,23 @@ def ensure_timezone_aware(dt: datetime, default_tz: Optional[ZoneInfo] = None) -
     return dt
 
 
+@lru_cache(maxsize=128)
+def _fromisoformat_cached(iso_string: str) -> datetime:
+    """Cached datetime.fromisoformat, the same stored timestamps are parsed on every status request."""
+    return datetime.fromisoformat(iso_string)
+
+
 def parse_iso_datetime(iso_string: str) -> datetime:
     """
     Parses an ISO format datetime string and ensures it's timezone-aware.
     If the string doesn't contain timezone info, applies bot timezone.
+    Only the parsing is cached: the bot timezone is applied on every call,
+    so naive timestamps follow a timezone change via /setup.
 
     :param iso_string: ISO format datetime string
     :return: Timezone-aware datetime object
     """
-    dt = datetime.fromisoformat(iso_string)
-    return ensure_timezone_aware(dt)
+    return ensure_timezone_aware(_fromisoformat_cached(iso_string))
 
 
 def to_utc(dt: datetime) -> datetime: